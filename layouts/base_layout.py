@@ -4,13 +4,51 @@ Base layout class for panel configurations.
 This module defines the abstract interface that all panel layouts must implement.
 """
 
+import numpy as np
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections.abc import Sequence
+from typing import List, Any, NamedTuple, Union
 from dataclasses import dataclass
 from perspective.transforms import Point3D
 
 
-@dataclass
+# Conversion factors to inches for every supported unit
+_TO_INCHES = {
+    "inches": 1.0,
+    "feet": 12.0,
+    "meters": 39.37,
+    "cm": 0.3937,
+    "mm": 0.0394
+}
+
+# Precomputed (from_units, to_units) -> factor table
+_UNIT_SCALE = {
+    (from_units, to_units): from_inches / to_inches
+    for from_units, from_inches in _TO_INCHES.items()
+    for to_units, to_inches in _TO_INCHES.items()
+}
+
+
+def unit_scale(from_units: str, to_units: str) -> float:
+    """
+    Get the factor that converts a length in one unit system to another.
+    
+    Unknown units are treated as inches.
+    
+    Args:
+        from_units: Source unit system ("inches", "feet", "meters", "cm", "mm")
+        to_units: Target unit system
+        
+    Returns:
+        Scaling factor
+    """
+    scale = _UNIT_SCALE.get((from_units, to_units))
+    if scale is None:
+        scale = _TO_INCHES.get(from_units, 1.0) / _TO_INCHES.get(to_units, 1.0)
+    return scale
+
+
+@dataclass(slots=True)
 class PanelDimensions:
     """Physical dimensions of a panel."""
     width: float
@@ -18,7 +56,7 @@ class PanelDimensions:
     units: str = "inches"
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomDimensions:
     """Dimensions of the room being represented."""
     width: float
@@ -27,46 +65,155 @@ class RoomDimensions:
     units: str = "feet"
 
 
-@dataclass 
+class Bounds(NamedTuple):
+    """
+    Axis-aligned bounding box.
+    
+    Fields are read as attributes (`bounds.max_x`); string indexing
+    (`bounds["max_x"]`) is kept for callers written against the old dict.
+    """
+    min_x: float
+    max_x: float
+    min_y: float
+    max_y: float
+    min_z: float
+    max_z: float
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+_EMPTY_BOUNDS = Bounds(0, 0, 0, 0, 0, 0)
+
+
+def _bounds_from_array(corners: np.ndarray) -> Bounds:
+    """Reduce an (N, 3) corner array to its bounding box."""
+    min_x, min_y, min_z = corners.min(axis=0).tolist()
+    max_x, max_y, max_z = corners.max(axis=0).tolist()
+    
+    return Bounds(min_x, max_x, min_y, max_y, min_z, max_z)
+
+
+class CornerView(Sequence):
+    """
+    Read-only sequence of Point3D corners backed by an (N, 3) array.
+    
+    Point3D objects are only created when a corner is actually accessed.
+    """
+    __slots__ = ("_array",)
+    
+    def __init__(self, array: np.ndarray):
+        """
+        Wrap a corner array.
+        
+        Args:
+            array: (N, 3) array of corner coordinates
+        """
+        self._array = array
+    
+    def __len__(self) -> int:
+        return len(self._array)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Point3D(*row) for row in self._array[index].tolist()]
+        return Point3D(*self._array[index].tolist())
+    
+    def __eq__(self, other) -> bool:
+        # Compare like the list of Point3D it stands in for
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"CornerView({self._array.tolist()!r})"
+
+
+@dataclass(init=False, eq=False, slots=True)
 class Panel:
     """
     Represents a single panel in the layout.
     
     A panel is defined by its corner points in 3D space and metadata.
+    Corners are stored only as the contiguous (N, 3) `corners_array`, so
+    centers and bounds reduce in a single vectorized pass. `corners` is a
+    read-only CornerView of that array, whether the panel was built from
+    Point3D objects or from an array; assign to `corners` to move the panel.
+    
+    Equality is written by hand because the generated dataclass comparison
+    cannot compare arrays: panels are equal when label, type, normal and
+    corner coordinates match. Like the plain dataclass, panels are unhashable.
     """
     label: str
-    corners: List[Point3D]  # 4 corners in counter-clockwise order
-    normal: Point3D         # Surface normal vector
-    panel_type: str         # "floor", "wall", "ceiling"
+    corners_array: np.ndarray   # (N, 3) corners in counter-clockwise order
+    normal: Point3D             # Surface normal vector
+    panel_type: str             # "floor", "wall", "ceiling"
+    
+    def __init__(self, label: str, corners: Union[Sequence[Point3D], np.ndarray],
+                 normal: Point3D, panel_type: str):
+        """
+        Initialize a panel.
+        
+        Args:
+            label: Human-readable panel name
+            corners: 4 corners in counter-clockwise order, as Point3D objects
+                or an (N, 3) array
+            normal: Surface normal vector
+            panel_type: "floor", "wall", "ceiling"
+        """
+        self.label = label
+        self.corners = corners
+        self.normal = normal
+        self.panel_type = panel_type
+    
+    @property
+    def corners(self) -> CornerView:
+        """Read-only Point3D view of corners_array."""
+        return CornerView(self.corners_array)
+    
+    @corners.setter
+    def corners(self, corners: Union[Sequence[Point3D], np.ndarray]):
+        """Replace the corners, copying them into a new corners_array."""
+        if isinstance(corners, np.ndarray):
+            self.corners_array = np.array(corners, dtype=np.float64).reshape(-1, 3)
+        else:
+            self.corners_array = np.array(
+                [(corner.x, corner.y, corner.z) for corner in corners],
+                dtype=np.float64
+            ).reshape(-1, 3)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Panel):
+            return NotImplemented
+        return (
+            self.label == other.label
+            and self.panel_type == other.panel_type
+            and self.normal == other.normal
+            and np.array_equal(self.corners_array, other.corners_array)
+        )
+    
+    __hash__ = None
     
     def get_center(self) -> Point3D:
         """Calculate the center point of the panel."""
-        if len(self.corners) != 4:
+        if len(self.corners_array) != 4:
             raise ValueError("Panel must have exactly 4 corners")
         
-        x = sum(corner.x for corner in self.corners) / 4
-        y = sum(corner.y for corner in self.corners) / 4
-        z = sum(corner.z for corner in self.corners) / 4
-        
-        return Point3D(x, y, z)
+        return Point3D(*self.corners_array.mean(axis=0).tolist())
     
-    def get_bounds(self) -> Dict[str, float]:
+    def get_bounds(self) -> Bounds:
         """Get bounding box of the panel."""
-        if not self.corners:
-            return {"min_x": 0, "max_x": 0, "min_y": 0, "max_y": 0, "min_z": 0, "max_z": 0}
+        if not len(self.corners_array):
+            return _EMPTY_BOUNDS
         
-        xs = [corner.x for corner in self.corners]
-        ys = [corner.y for corner in self.corners]
-        zs = [corner.z for corner in self.corners]
-        
-        return {
-            "min_x": min(xs), "max_x": max(xs),
-            "min_y": min(ys), "max_y": max(ys),
-            "min_z": min(zs), "max_z": max(zs)
-        }
+        return _bounds_from_array(self.corners_array)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     """Configuration for a panel layout."""
     panel_dimensions: PanelDimensions
@@ -102,12 +249,50 @@ class BaseLayout(ABC):
         
         self.config = config
         self._panels = None
+        self._corners = None
+        self._corner_sources = []
+        self._bounds = None
+        self._center = None
+        self._description = None
+        self._config_key = self._current_config_key()
+    
+    def invalidate(self):
+        """
+        Drop cached panels and derived geometry so they are rebuilt on next access.
+        
+        Config changes are picked up automatically; call this after editing
+        a panel's corners_array in place.
+        """
+        self._panels = None
+        self._corners = None
+        self._corner_sources = []
+        self._bounds = None
+        self._center = None
+        self._description = None
+    
+    def _current_config_key(self) -> tuple:
+        """Snapshot the config values the cached geometry is derived from."""
+        panel = self.config.panel_dimensions
+        room = self.config.room_dimensions
+        return (panel.width, panel.height, panel.units,
+                room.width, room.height, room.depth, room.units,
+                self.config.layout_type)
+    
+    def _sync_config(self):
+        """Invalidate the caches if the config has changed since they were built."""
+        key = self._current_config_key()
+        if key != self._config_key:
+            self.invalidate()
+            self._config_key = key
         
     @abstractmethod
     def get_panels(self) -> List[Panel]:
         """
         Get list of panels in this layout.
         
+        Implementations that cache their panels should call _sync_config()
+        first so config changes rebuild them.
+        
         Returns:
             List of Panel objects defining the 3D geometry
         """
@@ -133,30 +318,45 @@ class BaseLayout(ABC):
         """
         pass
     
-    def get_total_bounds(self) -> Dict[str, float]:
+    def get_corners_array(self) -> np.ndarray:
         """
-        Get bounding box that encompasses all panels.
+        Get every panel corner stacked into one contiguous array.
         
         Returns:
-            Dictionary with min/max coordinates for all axes
+            (N, 3) array of corner coordinates, in panel order
         """
-        panels = self.get_panels()
-        if not panels:
-            return {"min_x": 0, "max_x": 0, "min_y": 0, "max_y": 0, "min_z": 0, "max_z": 0}
+        # Panels replace their corners_array when moved, so identity tells us
+        # whether the stacked copy (and the bounds derived from it) is stale
+        sources = [panel.corners_array for panel in self.get_panels()]
+        cached = self._corner_sources
+        if (self._corners is None or len(sources) != len(cached)
+                or any(source is not old for source, old in zip(sources, cached))):
+            if sources:
+                self._corners = np.concatenate(sources, axis=0)
+            else:
+                self._corners = np.empty((0, 3), dtype=np.float64)
+            self._corner_sources = sources
+            self._bounds = None
+            self._center = None
+        return self._corners
+    
+    def get_total_bounds(self) -> Bounds:
+        """
+        Get bounding box that encompasses all panels.
         
-        all_corners = []
-        for panel in panels:
-            all_corners.extend(panel.corners)
+        Returns:
+            Bounds with min/max coordinates for all axes
+        """
+        all_corners = self.get_corners_array()
+        if self._bounds is not None:
+            return self._bounds
         
-        xs = [corner.x for corner in all_corners]
-        ys = [corner.y for corner in all_corners]
-        zs = [corner.z for corner in all_corners]
+        if not len(all_corners):
+            return _EMPTY_BOUNDS
         
-        return {
-            "min_x": min(xs), "max_x": max(xs),
-            "min_y": min(ys), "max_y": max(ys),
-            "min_z": min(zs), "max_z": max(zs)
-        }
+        # Two vectorized reductions over the stacked corners
+        self._bounds = _bounds_from_array(all_corners)
+        return self._bounds
     
     def get_center_point(self) -> Point3D:
         """
@@ -166,12 +366,16 @@ class BaseLayout(ABC):
             Center point of all panels
         """
         bounds = self.get_total_bounds()
+        if self._center is not None:
+            return self._center
         
-        center_x = (bounds["min_x"] + bounds["max_x"]) / 2
-        center_y = (bounds["min_y"] + bounds["max_y"]) / 2
-        center_z = (bounds["min_z"] + bounds["max_z"]) / 2
         
-        return Point3D(center_x, center_y, center_z)
+        center_x = (bounds.min_x + bounds.max_x) / 2
+        center_y = (bounds.min_y + bounds.max_y) / 2
+        center_z = (bounds.min_z + bounds.max_z) / 2
+        
+        self._center = Point3D(center_x, center_y, center_z)
+        return self._center
     
     def scale_to_units(self, target_units: str) -> float:
         """
@@ -183,19 +387,7 @@ class BaseLayout(ABC):
         Returns:
             Scaling factor
         """
-        # Define conversion factors to inches
-        to_inches = {
-            "inches": 1.0,
-            "feet": 12.0,
-            "meters": 39.37,
-            "cm": 0.3937,
-            "mm": 0.0394
-        }
-        
-        panel_to_inches = to_inches.get(self.config.panel_dimensions.units, 1.0)
-        target_to_inches = to_inches.get(target_units, 1.0)
-        
-        return panel_to_inches / target_to_inches
+        return unit_scale(self.config.panel_dimensions.units, target_units)
     
     def get_description(self) -> str:
         """
@@ -204,11 +396,14 @@ class BaseLayout(ABC):
         Returns:
             Human-readable description
         """
-        panels = self.get_panels()
-        panel_names = [panel.label for panel in panels]
-        
-        return f"{self.get_layout_name()}: {', '.join(panel_names)} " \
-               f"({self.config.panel_dimensions.width}\" × {self.config.panel_dimensions.height}\")"
+        self._sync_config()
+        if self._description is None:
+            panel_names = [panel.label for panel in self.get_panels()]
+            self._description = (
+                f"{self.get_layout_name()}: {', '.join(panel_names)} "
+                f"({self.config.panel_dimensions.width}\" × {self.config.panel_dimensions.height}\")"
+            )
+        return self._description
 
 
 def create_standard_panel_dimensions(size_preset: str = "standard") -> PanelDimensions:
@@ -5,8 +5,9 @@ This layout creates a corner room with floor and two walls meeting at a corner.
 Perfect for simple forced perspective compositions.
 """
 
+import numpy as np
 from typing import List
-from .base_layout import BaseLayout, Panel, LayoutConfig
+from .base_layout import BaseLayout, Panel, LayoutConfig, unit_scale
 from perspective.transforms import Point3D
 
 
@@ -32,6 +33,7 @@ class ThreePanelLayout(BaseLayout):
     
     def get_panels(self) -> List[Panel]:
         """Generate the three panels: floor, left wall, right wall."""
+        self._sync_config()
         if self._panels is None:
             self._panels = self._create_panels()
         return self._panels
@@ -44,107 +46,39 @@ class ThreePanelLayout(BaseLayout):
         """Get panel count."""
         return 3
     
+    # Panel templates in unit-cube coordinates, scaled by (width, height, depth).
+    # Wall corner order: [near-bottom, far-bottom, far-top, near-top]
+    _UNIT_CORNERS = np.array([
+        # Floor extends from the viewer toward the back corner (XZ plane)
+        [[0, 0, 0], [1, 0, 0], [1, 0, 1], [0, 0, 1]],
+        # Left wall runs along Z (YZ plane)
+        [[0, 0, 0], [0, 0, 1], [0, 1, 1], [0, 1, 0]],
+        # Right wall runs along X (XY plane)
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+    ], dtype=np.float64)
+    # Inward-facing normals: floor up, left wall +X, right wall +Z
+    _NORMALS = ((0.0, 1.0, 0.0), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0))
+    _LABELS = ("Floor", "Left Wall", "Right Wall")
+    _TYPES = ("floor", "wall", "wall")
+    
     def _create_panels(self) -> List[Panel]:
         """Create the three panel geometries."""
-        panels = []
-        
-        # Use room dimensions to define the 3D space
-        room_width = self.config.room_dimensions.width
-        room_height = self.config.room_dimensions.height
-        room_depth = self.config.room_dimensions.depth
-        
         # Scale factor from room units to panel units
         scale = self._get_scale_factor()
         
         # Convert room dimensions to working units (typically same as panel units)
-        width = room_width * scale
-        height = room_height * scale
-        depth = room_depth * scale
-        
-        # Create floor panel
-        floor_panel = self._create_floor_panel(width, depth)
-        panels.append(floor_panel)
-        
-        # Create left wall panel (along Z axis)
-        left_wall_panel = self._create_left_wall_panel(depth, height)
-        panels.append(left_wall_panel)
+        room = self.config.room_dimensions
+        dims = np.array([room.width, room.height, room.depth]) * scale
         
-        # Create right wall panel (along X axis)
-        right_wall_panel = self._create_right_wall_panel(width, height)
-        panels.append(right_wall_panel)
+        # One broadcast multiply scales all three panels at once
+        corners = self._UNIT_CORNERS * dims
         
-        return panels
-    
-    def _create_floor_panel(self, width: float, depth: float) -> Panel:
-        """
-        Create the floor panel for an inner corner.
-        
-        The floor extends from the viewer toward the back corner.
-        """
-        corners = [
-            Point3D(0.0, 0.0, 0.0),      # Near corner (viewer side)
-            Point3D(width, 0.0, 0.0),    # Near right edge
-            Point3D(width, 0.0, depth),  # Far right corner (back)
-            Point3D(0.0, 0.0, depth)     # Far left corner (back)
+        return [
+            Panel(label=label, corners=panel_corners,
+                  normal=Point3D(*normal), panel_type=panel_type)
+            for label, panel_type, panel_corners, normal
+            in zip(self._LABELS, self._TYPES, corners, self._NORMALS)
         ]
-        
-        # Floor normal points up (positive Y)
-        normal = Point3D(0.0, 1.0, 0.0)
-        
-        return Panel(
-            label="Floor",
-            corners=corners,
-            normal=normal,
-            panel_type="floor"
-        )
-    
-    def _create_left_wall_panel(self, depth: float, height: float) -> Panel:
-        """
-        Create the left wall panel for an inner corner.
-        
-        The left wall is on the viewer's left side, extending back.
-        Corner order: [near-bottom, far-bottom, far-top, near-top]
-        """
-        corners = [
-            Point3D(0.0, 0.0, 0.0),      # Near bottom corner (viewer side)
-            Point3D(0.0, 0.0, depth),    # Far bottom corner (back wall)
-            Point3D(0.0, height, depth), # Far top corner (back wall)
-            Point3D(0.0, height, 0.0)    # Near top corner (viewer side)
-        ]
-        
-        # Left wall normal points inward (positive X - toward the room)
-        normal = Point3D(1.0, 0.0, 0.0)
-        
-        return Panel(
-            label="Left Wall",
-            corners=corners,
-            normal=normal,
-            panel_type="wall"
-        )
-    
-    def _create_right_wall_panel(self, width: float, height: float) -> Panel:
-        """
-        Create the right wall panel for an inner corner.
-        
-        The right wall is on the viewer's right side, extending back.
-        Corner order: [near-bottom, far-bottom, far-top, near-top]
-        """
-        corners = [
-            Point3D(0.0, 0.0, 0.0),      # Near bottom corner (viewer side)
-            Point3D(width, 0.0, 0.0),    # Far bottom corner (back wall)
-            Point3D(width, height, 0.0), # Far top corner (back wall)
-            Point3D(0.0, height, 0.0)    # Near top corner (viewer side)
-        ]
-        
-        # Right wall normal points inward (positive Z - toward the room)
-        normal = Point3D(0.0, 0.0, 1.0)
-        
-        return Panel(
-            label="Right Wall", 
-            corners=corners,
-            normal=normal,
-            panel_type="wall"
-        )
     
     def _get_scale_factor(self) -> float:
         """
@@ -153,40 +87,38 @@ class ThreePanelLayout(BaseLayout):
         Returns:
             Scale factor for unit conversion
         """
-        # Define conversion factors to inches
-        to_inches = {
-            "inches": 1.0,
-            "feet": 12.0,
-            "meters": 39.37,
-            "cm": 0.3937,
-            "mm": 0.0394
-        }
-        
-        room_units = self.config.room_dimensions.units
-        panel_units = self.config.panel_dimensions.units
-        
-        room_to_inches = to_inches.get(room_units, 1.0)
-        panel_to_inches = to_inches.get(panel_units, 1.0)
-        
         # Convert room units to panel units
-        return room_to_inches / panel_to_inches
+        return unit_scale(
+            self.config.room_dimensions.units,
+            self.config.panel_dimensions.units
+        )
+    
+    # Camera placement as fractions of the layout's max extents, per view mode:
+    # "corner" stands in the room looking at the corner, "orbit" views the
+    # corner from outside the room
+    _CAMERA_VIEW_FACTORS = {
+        "corner": (-0.5, 0.4, -0.5),
+        "orbit": (1.5, 0.6, 1.5),
+    }
     
-    def get_optimal_camera_position(self) -> Point3D:
+    def get_optimal_camera_position(self, view_mode: str = "corner") -> Point3D:
         """
         Get an optimal camera position for viewing this inner corner layout.
         
+        Args:
+            view_mode: "corner" to stand in the room looking at the corner,
+                or "orbit" to view the corner from outside
+        
         Returns:
-            Camera position as if standing in the room looking at the corner
+            Camera position for the requested view mode
         """
-        bounds = self.get_total_bounds()
+        if view_mode not in self._CAMERA_VIEW_FACTORS:
+            raise ValueError(f"Unknown camera view mode: {view_mode}")
         
-        # Position camera in front of the corner, looking toward it
-        # This simulates standing in the room looking at the corner
-        x = bounds["max_x"] * -0.5  # Back away from the corner in X
-        y = bounds["max_y"] * 0.4   # Eye level height
-        z = bounds["max_z"] * -0.5  # Back away from the corner in Z
+        bounds = self.get_total_bounds()
+        fx, fy, fz = self._CAMERA_VIEW_FACTORS[view_mode]
         
-        return Point3D(x, y, z)
+        return Point3D(bounds.max_x * fx, bounds.max_y * fy, bounds.max_z * fz)
     
     def get_optimal_camera_target(self) -> Point3D:
         """
@@ -198,9 +130,9 @@ class ThreePanelLayout(BaseLayout):
         bounds = self.get_total_bounds()
         
         # Target the back corner where walls meet
-        x = bounds["max_x"] * 0.8
-        y = bounds["max_y"] * 0.3
-        z = bounds["max_z"] * 0.8
+        x = bounds.max_x * 0.8
+        y = bounds.max_y * 0.3
+        z = bounds.max_z * 0.8
         
         return Point3D(x, y, z)
 
@@ -4,31 +4,106 @@ Camera controls for perspective projection.
 This module handles camera positioning, field of view, and view matrix generation.
 """
 
+import math
 import numpy as np
+from collections import OrderedDict
 from typing import Optional
-from dataclasses import dataclass
-from .transforms import Point3D, Vector3D, Matrix4x4, degrees_to_radians
+from dataclasses import dataclass, field
+from .transforms import Point3D, Vector3D, Matrix4x4, degrees_to_radians, project_points_to_screen
 
 
-@dataclass
+@dataclass(init=False, eq=False, slots=True)
 class CameraConfig:
-    """Configuration for camera parameters."""
-    position: Point3D
-    target: Point3D
+    """
+    Configuration for camera parameters.
+    
+    Position and target are stored as the two rows of one (2, 3) array so
+    camera math can treat them with single vector operations; the
+    ``position`` and ``target`` properties expose them as Point3D. Those
+    getters return copies, so assign ``config.position`` rather than
+    editing the returned point in place.
+    
+    ``points`` is a keyword-only argument so ``dataclasses.replace`` can
+    rebuild a config; position or target passed alongside it override the
+    matching row. Equality is written by hand because the generated
+    comparison cannot compare arrays, and like the plain dataclass,
+    configs are unhashable.
+    """
     fov_degrees: float
     near_plane: float = 0.1
     far_plane: float = 100.0
     up_vector: Vector3D = None
+    points: np.ndarray = field(default=None, repr=False)
+    
+    def __init__(self, position: Optional[Point3D] = None, target: Optional[Point3D] = None,
+                 fov_degrees: Optional[float] = None, near_plane: float = 0.1,
+                 far_plane: float = 100.0, up_vector: Optional[Vector3D] = None,
+                 *, points: Optional[np.ndarray] = None):
+        """Pack position and target into one array and set the default up vector."""
+        if points is None and (position is None or target is None):
+            raise TypeError("CameraConfig requires position and target")
+        if fov_degrees is None:
+            raise TypeError("CameraConfig requires fov_degrees")
+        
+        if points is not None:
+            self.points = np.array(points, dtype=np.float64).reshape(2, 3)
+        else:
+            self.points = np.empty((2, 3), dtype=np.float64)
+        if position is not None:
+            self.points[0] = (position.x, position.y, position.z)
+        if target is not None:
+            self.points[1] = (target.x, target.y, target.z)
+        self.fov_degrees = fov_degrees
+        self.near_plane = near_plane
+        self.far_plane = far_plane
+        self.up_vector = up_vector if up_vector is not None else Vector3D(0.0, 1.0, 0.0)
+    
+    @property
+    def position(self) -> Point3D:
+        """Get a copy of the camera position."""
+        return Point3D(*self.points[0].tolist())
+    
+    @position.setter
+    def position(self, value: Point3D):
+        """Set camera position."""
+        self.points[0] = (value.x, value.y, value.z)
     
-    def __post_init__(self):
-        """Set default up vector if not provided."""
-        if self.up_vector is None:
-            self.up_vector = Vector3D(0.0, 1.0, 0.0)
+    @property
+    def target(self) -> Point3D:
+        """Get a copy of the camera target."""
+        return Point3D(*self.points[1].tolist())
+    
+    @target.setter
+    def target(self, value: Point3D):
+        """Set camera target."""
+        self.points[1] = (value.x, value.y, value.z)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CameraConfig):
+            return NotImplemented
+        return (
+            self.fov_degrees == other.fov_degrees
+            and self.near_plane == other.near_plane
+            and self.far_plane == other.far_plane
+            and self.up_vector == other.up_vector
+            and np.array_equal(self.points, other.points)
+        )
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        """Show position and target as points rather than the packed array."""
+        return (f"CameraConfig(position={self.position!r}, target={self.target!r}, "
+                f"fov_degrees={self.fov_degrees!r}, near_plane={self.near_plane!r}, "
+                f"far_plane={self.far_plane!r}, up_vector={self.up_vector!r})")
 
 
 class Camera:
     """Camera for 3D to 2D perspective projection."""
     
+    # Number of projection matrices kept, e.g. for preview and export viewports
+    PROJECTION_CACHE_SIZE = 4
+    
     def __init__(self, config: CameraConfig):
         """
         Initialize camera with given configuration.
@@ -38,8 +113,11 @@ class Camera:
         """
         self.config = config
         self._view_matrix = None
-        self._projection_matrix = None
-        self._needs_update = True
+        self._view_dirty = True
+        self._view_state = None
+        self._projection_cache = OrderedDict()
+        self._view_projection_matrix = None
+        self._view_projection_sources = None
     
     @property
     def position(self) -> Point3D:
@@ -50,7 +128,7 @@ class Camera:
     def position(self, value: Point3D):
         """Set camera position."""
         self.config.position = value
-        self._needs_update = True
+        self._mark_view_dirty()
     
     @property
     def target(self) -> Point3D:
@@ -61,7 +139,7 @@ class Camera:
     def target(self, value: Point3D):
         """Set camera target."""
         self.config.target = value
-        self._needs_update = True
+        self._mark_view_dirty()
     
     @property
     def fov_degrees(self) -> float:
@@ -74,12 +152,28 @@ class Camera:
         if not 1 <= value <= 179:
             raise ValueError("FOV must be between 1 and 179 degrees")
         self.config.fov_degrees = value
-        self._needs_update = True
+    
+    def _get_view_state(self) -> tuple:
+        """Snapshot the coordinates the view matrix is built from."""
+        up = self.config.up_vector
+        return (*self.config.points.ravel().tolist(), up.x, up.y, up.z)
+    
+    def _mark_view_dirty(self):
+        """Invalidate the view matrix unless the camera did not actually move."""
+        # Compare coordinates so re-setting the same pose keeps the cached matrix
+        if self._get_view_state() != self._view_state:
+            self._view_dirty = True
     
     def get_view_matrix(self) -> Matrix4x4:
         """Get the view transformation matrix."""
-        if self._needs_update or self._view_matrix is None:
-            self._update_matrices()
+        if self._view_dirty or self._view_matrix is None:
+            self._view_matrix = Matrix4x4.look_at(
+                self.config.position,
+                self.config.target,
+                self.config.up_vector
+            )
+            self._view_state = self._get_view_state()
+            self._view_dirty = False
         return self._view_matrix
     
     def get_projection_matrix(self, aspect_ratio: float) -> Matrix4x4:
@@ -92,36 +186,70 @@ class Camera:
         Returns:
             Perspective projection matrix
         """
-        if self._needs_update or self._projection_matrix is None:
-            self._update_matrices(aspect_ratio)
-        return self._projection_matrix
-    
-    def _update_matrices(self, aspect_ratio: float = 1.0):
-        """Update view and projection matrices."""
-        # Create view matrix using look-at
-        self._view_matrix = Matrix4x4.look_at(
-            self.config.position,
-            self.config.target,
-            self.config.up_vector
+        # The projection only depends on these inputs, so recent matrices are
+        # kept per key and rebuilt only for an unseen combination
+        key = (
+            aspect_ratio,
+            self.config.fov_degrees,
+            self.config.near_plane,
+            self.config.far_plane
         )
+        projection_matrix = self._projection_cache.get(key)
+        if projection_matrix is not None:
+            self._projection_cache.move_to_end(key)
+            return projection_matrix
         
-        # Create projection matrix
-        fov_radians = degrees_to_radians(self.config.fov_degrees)
-        self._projection_matrix = Matrix4x4.perspective(
-            fov_radians,
+        projection_matrix = Matrix4x4.perspective(
+            degrees_to_radians(self.config.fov_degrees),
             aspect_ratio,
             self.config.near_plane,
             self.config.far_plane
         )
+        self._projection_cache[key] = projection_matrix
+        if len(self._projection_cache) > self.PROJECTION_CACHE_SIZE:
+            self._projection_cache.popitem(last=False)
+        return projection_matrix
+    
+    def get_view_projection_matrix(self, aspect_ratio: float) -> Matrix4x4:
+        """
+        Get the combined projection @ view matrix.
+        
+        Args:
+            aspect_ratio: Screen width / height ratio
+            
+        Returns:
+            Matrix taking world points straight to clip space
+        """
+        view_matrix = self.get_view_matrix()
+        projection_matrix = self.get_projection_matrix(aspect_ratio)
         
-        self._needs_update = False
+        # Both inputs are cached objects, so identity tells us whether either changed
+        sources = self._view_projection_sources
+        if (self._view_projection_matrix is None or sources[0] is not view_matrix
+                or sources[1] is not projection_matrix):
+            self._view_projection_matrix = projection_matrix.multiply(view_matrix)
+            self._view_projection_sources = (view_matrix, projection_matrix)
+        return self._view_projection_matrix
+    
+    def project_points(self, points: np.ndarray, screen_width: int, screen_height: int) -> np.ndarray:
+        """
+        Project a batch of world points to screen coordinates.
+        
+        Args:
+            points: (N, 3) array of world points
+            screen_width: Screen width in pixels
+            screen_height: Screen height in pixels
+            
+        Returns:
+            (N, 2) array of screen coordinates
+        """
+        matrix = self.get_view_projection_matrix(screen_width / screen_height)
+        return project_points_to_screen(points, matrix, screen_width, screen_height)
     
     def get_distance_to_target(self) -> float:
         """Get distance from camera to target."""
-        dx = self.config.target.x - self.config.position.x
-        dy = self.config.target.y - self.config.position.y
-        dz = self.config.target.z - self.config.position.z
-        return np.sqrt(dx*dx + dy*dy + dz*dz)
+        points = self.config.points
+        return float(np.linalg.norm(points[1] - points[0]))
     
     def set_distance_to_target(self, distance: float):
         """
@@ -133,24 +261,18 @@ class Camera:
         if distance <= 0:
             raise ValueError("Distance must be positive")
         
-        # Calculate current direction vector
         current_distance = self.get_distance_to_target()
         if current_distance == 0:
             raise ValueError("Camera and target cannot be at the same position")
+        if abs(distance - current_distance) < 1e-9:
+            return
         
-        # Calculate unit direction vector from target to camera
-        direction = Vector3D(
-            (self.config.position.x - self.config.target.x) / current_distance,
-            (self.config.position.y - self.config.target.y) / current_distance,
-            (self.config.position.z - self.config.target.z) / current_distance
-        )
-        
-        # Set new position
-        self.position = Point3D(
-            self.config.target.x + direction.x * distance,
-            self.config.target.y + direction.y * distance,
-            self.config.target.z + direction.z * distance
-        )
+        # Rescale the target-to-camera offset to the new distance in place
+        points = self.config.points
+        offset = points[0] - points[1]
+        offset *= distance / current_distance
+        points[0] = points[1] + offset
+        self._mark_view_dirty()
     
     def orbit_around_target(self, azimuth_degrees: float, elevation_degrees: float, distance: float):
         """
@@ -167,17 +289,19 @@ class Camera:
         azimuth_rad = degrees_to_radians(azimuth_degrees)
         elevation_rad = degrees_to_radians(elevation_degrees)
         
+        # Scalar trig via math; only the final offset is built as an array
+        cos_e = math.cos(elevation_rad)
+        sin_e = math.sin(elevation_rad)
+        cos_a = math.cos(azimuth_rad)
+        sin_a = math.sin(azimuth_rad)
+        
         # Convert spherical to cartesian coordinates
-        x = distance * np.cos(elevation_rad) * np.cos(azimuth_rad)
-        y = distance * np.sin(elevation_rad)
-        z = distance * np.cos(elevation_rad) * np.sin(azimuth_rad)
+        offset = distance * np.array([cos_e * cos_a, sin_e, cos_e * sin_a])
         
         # Position relative to target
-        self.position = Point3D(
-            self.config.target.x + x,
-            self.config.target.y + y,
-            self.config.target.z + z
-        )
+        points = self.config.points
+        points[0] = points[1] + offset
+        self._mark_view_dirty()
 
 
 def create_standard_camera(distance: float = 8.0, fov_degrees: float = 50.0) -> Camera:
@@ -5,20 +5,145 @@ This module creates perspective-accurate grid lines for each panel in a layout.
 """
 
 import numpy as np
-from typing import List, Tuple, Dict, Any
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Any, NamedTuple, Union
 from dataclasses import dataclass
-from .transforms import Point3D, Point2D, project_to_screen
+from enum import Enum
+from .transforms import Point2D, project_points_to_screen
 from .camera import Camera
+from .kernels import NUMBA_AVAILABLE, project_clip_lines
 from layouts.base_layout import Panel
 
 
-@dataclass
+class LineType(str, Enum):
+    """Grid line categories; members compare equal to their string values."""
+    HORIZONTAL = "horizontal"
+    VERTICAL = "vertical"
+    BOUNDARY = "boundary"
+    
+    # Print and format as the plain value, like the strings this enum replaced
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+@dataclass(slots=True)
 class GridLine:
     """Represents a single grid line in 2D screen space."""
     start: Point2D
     end: Point2D
     panel_label: str
-    line_type: str  # "horizontal", "vertical", "boundary"
+    line_type: LineType  # or the equivalent string: "horizontal", "vertical", "boundary"
+
+
+# Line types in the order of their uint8 codes in GridLineBatch.line_types
+LINE_TYPES = tuple(LineType)
+_HORIZONTAL, _VERTICAL, _BOUNDARY = range(len(LINE_TYPES))
+_LINE_TYPE_CODES = {line_type: code for code, line_type in enumerate(LINE_TYPES)}
+
+
+class _LineFamily(NamedTuple):
+    """
+    A group of 3D lines of one type, described without materializing them.
+    
+    Either explicit (N, 3) endpoints, or a single template line copied to
+    each of ``positions`` along coordinate ``axis``.
+    """
+    starts: np.ndarray           # (N, 3) start points, or (3,) template start
+    ends: np.ndarray             # (N, 3) end points, or (3,) template end
+    line_type: int
+    axis: int = -1               # Coordinate index replaced per line; -1 for explicit
+    positions: np.ndarray = None
+    
+    @property
+    def count(self) -> int:
+        """Number of lines in the family."""
+        return len(self.positions) if self.axis >= 0 else len(self.starts)
+    
+    def write(self, starts_out: np.ndarray, ends_out: np.ndarray):
+        """Write the family's endpoints into (count, 3) output slices."""
+        starts_out[:] = self.starts
+        ends_out[:] = self.ends
+        if self.axis >= 0:
+            starts_out[:, self.axis] = self.positions
+            ends_out[:, self.axis] = self.positions
+
+
+class _LineGeometry(NamedTuple):
+    """3D grid lines for a whole scene, before projection."""
+    starts: np.ndarray        # (N, 3) float32 start points
+    ends: np.ndarray          # (N, 3) float32 end points
+    line_types: np.ndarray    # (N,) uint8 index into LINE_TYPES
+    panel_ids: np.ndarray     # (N,) index of the owning panel
+
+
+@dataclass
+class GridLineBatch:
+    """
+    Grid lines for a whole scene stored as parallel arrays.
+    
+    Avoids allocating Point2D/GridLine objects until lines are actually
+    needed one by one, e.g. for rendering.
+    """
+    starts: np.ndarray        # (N, 2) screen-space start points, float32 when generated
+    ends: np.ndarray          # (N, 2) screen-space end points, float32 when generated
+    panel_ids: np.ndarray     # (N,) index into panel_labels
+    line_types: np.ndarray    # (N,) uint8 index into LINE_TYPES
+    panel_labels: Tuple[str, ...]
+    
+    def __len__(self) -> int:
+        return len(self.line_types)
+    
+    @classmethod
+    def from_lines(cls, lines: List[GridLine]) -> 'GridLineBatch':
+        """
+        Pack GridLine objects into a batch.
+        
+        Coordinates are kept as float64 so no precision is lost, and each
+        distinct panel label becomes one panel in order of first appearance.
+        
+        Args:
+            lines: Grid lines to pack
+        
+        Returns:
+            GridLineBatch holding the same lines in the same order
+        """
+        panel_index = {}
+        panel_ids = np.fromiter(
+            (panel_index.setdefault(line.panel_label, len(panel_index)) for line in lines),
+            dtype=np.intp, count=len(lines)
+        )
+        coords = np.array(
+            [(line.start.x, line.start.y, line.end.x, line.end.y) for line in lines], dtype=np.float64
+        ).reshape(-1, 4)
+        
+        return cls(
+            starts=coords[:, :2],
+            ends=coords[:, 2:],
+            panel_ids=panel_ids,
+            line_types=np.fromiter(
+                (_LINE_TYPE_CODES[line.line_type] for line in lines), dtype=np.uint8, count=len(lines)
+            ),
+            panel_labels=tuple(panel_index)
+        )
+    
+    def to_lines(self) -> List[GridLine]:
+        """
+        Convert the batch into GridLine objects.
+        
+        Every call builds new GridLine objects, so callers may modify the
+        returned lines without affecting the batch or later calls.
+        
+        Returns:
+            List of grid lines in batch order
+        """
+        labels = self.panel_labels
+        return [
+            GridLine(Point2D(x1, y1), Point2D(x2, y2), labels[panel_id], LINE_TYPES[line_type])
+            for (x1, y1), (x2, y2), panel_id, line_type in zip(
+                self.starts.tolist(), self.ends.tolist(),
+                self.panel_ids.tolist(), self.line_types.tolist()
+            )
+        ]
 
 
 @dataclass
@@ -34,6 +159,9 @@ class GridConfig:
 class GridGenerator:
     """Generates perspective grids for panel layouts."""
     
+    # Number of recent (scene, camera, viewport, config) results kept for reuse
+    CACHE_SIZE = 8
+    
     def __init__(self, config: GridConfig = None):
         """
         Initialize grid generator.
@@ -42,6 +170,9 @@ class GridGenerator:
             config: Grid generation configuration
         """
         self.config = config or GridConfig()
+        self._cache = OrderedDict()
+        self._geometry_key = None
+        self._geometry = None
     
     def generate_grid(self, panels: List[Panel], camera: Camera, 
                      screen_width: int, screen_height: int) -> List[GridLine]:
@@ -57,381 +188,444 @@ class GridGenerator:
         Returns:
             List of grid lines in screen coordinates
         """
-        all_lines = []
+        return self.generate_grid_batch(panels, camera, screen_width, screen_height).to_lines()
+    
+    def generate_grid_batch(self, panels: List[Panel], camera: Camera,
+                            screen_width: int, screen_height: int) -> GridLineBatch:
+        """
+        Generate projected and clipped grid lines for all panels as arrays.
         
-        # Get camera matrices
-        view_matrix = camera.get_view_matrix()
+        Args:
+            panels: List of panels to generate grids for
+            camera: Camera for perspective projection
+            screen_width: Output image width in pixels
+            screen_height: Output image height in pixels
+            
+        Returns:
+            GridLineBatch of the visible lines that meet the minimum length.
+            Results are memoized, so an unchanged scene, camera, viewport and
+            config return the same (shared, read-only) batch.
+        """
+        # Combined camera matrix, cached on the camera between frames
         aspect_ratio = screen_width / screen_height
-        projection_matrix = camera.get_projection_matrix(aspect_ratio)
+        mvp = camera.get_view_projection_matrix(aspect_ratio).matrix
+        
+        scene_key = self._scene_key(panels)
+        key = (
+            scene_key,
+            mvp.tobytes(),
+            screen_width,
+            screen_height,
+            self.config.min_line_length
+        )
+        batch = self._cache.get(key)
+        if batch is not None:
+            self._cache.move_to_end(key)
+            return batch
+        
+        geometry = self._get_line_geometry(panels, scene_key)
+        batch = self._build_grid_batch(panels, geometry, mvp, screen_width, screen_height)
+        self._cache[key] = batch
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return batch
+    
+    def _scene_key(self, panels: List[Panel]) -> tuple:
+        """Build a memoization key from everything that affects the 3D lines."""
+        return (
+            tuple((panel.label, panel.panel_type, panel.corners_array.tobytes())
+                  for panel in panels),
+            (self.config.density, self.config.show_panel_boundaries)
+        )
+    
+    def _get_line_geometry(self, panels: List[Panel], scene_key: tuple) -> _LineGeometry:
+        """
+        Get the 3D grid lines for a scene, reusing them while it is unchanged.
         
-        for panel in panels:
-            # Generate grid for this panel
-            panel_lines = self._generate_panel_grid(
-                panel, view_matrix, projection_matrix, screen_width, screen_height
+        The lines do not depend on the camera or viewport, so orbiting the
+        camera or changing the output resolution only reruns projection.
+        """
+        if self._geometry_key != scene_key:
+            self._geometry = self._build_line_geometry(panels)
+            self._geometry_key = scene_key
+        return self._geometry
+    
+    def _build_line_geometry(self, panels: List[Panel]) -> _LineGeometry:
+        """Generate the 3D grid lines for all panels into flat buffers."""
+        # Spacing depends only on density, so it is shared by every panel
+        grid_spacing = _grid_spacing(self.config.density)
+        
+        # Describe each panel's lines first so the buffers can be sized exactly
+        panel_families = [self._generate_panel_grid(panel, grid_spacing) for panel in panels]
+        count = sum(family.count for families in panel_families for family in families)
+        
+        # Screen-space lines need no more than float32 precision, which halves
+        # the memory traffic of every batched pass
+        starts_3d = np.empty((count, 3), dtype=np.float32)
+        ends_3d = np.empty((count, 3), dtype=np.float32)
+        line_types = np.empty(count, dtype=np.uint8)
+        panel_ids = np.empty(count, dtype=np.intp)
+        
+        # Fill one flat buffer in panel order
+        index = 0
+        for panel_id, families in enumerate(panel_families):
+            for family in families:
+                block = slice(index, index + family.count)
+                family.write(starts_3d[block], ends_3d[block])
+                line_types[block] = family.line_type
+                panel_ids[block] = panel_id
+                index = block.stop
+        
+        return _LineGeometry(starts_3d, ends_3d, line_types, panel_ids)
+    
+    def _build_grid_batch(self, panels: List[Panel], geometry: _LineGeometry, mvp: np.ndarray,
+                          screen_width: int, screen_height: int) -> GridLineBatch:
+        """Project, clip and filter the 3D grid lines for all panels."""
+        starts_3d, ends_3d, line_types, panel_ids = geometry
+        
+        # Drop the lines of panels that cannot appear on screen at all
+        clip_bounds = _clip_bounds(screen_width, screen_height)
+        in_view = np.array([
+            _panel_in_view(panel.corners_array, mvp, screen_width, screen_height, clip_bounds)
+            for panel in panels
+        ], dtype=bool)
+        if not in_view.all():
+            rows = in_view[panel_ids]
+            starts_3d, ends_3d = starts_3d[rows], ends_3d[rows]
+            line_types, panel_ids = line_types[rows], panel_ids[rows]
+        count = len(starts_3d)
+        
+        # Project and clip every line of every panel in one batch
+        if NUMBA_AVAILABLE:
+            starts, ends, visible = project_clip_lines(
+                starts_3d, ends_3d, mvp, screen_width, screen_height, *clip_bounds
             )
-            all_lines.extend(panel_lines)
-        
-        # Filter out very short lines
-        filtered_lines = [
-            line for line in all_lines 
-            if self._calculate_line_length(line) >= self.config.min_line_length
-        ]
+        else:
+            screen = project_points_to_screen(
+                np.concatenate([starts_3d, ends_3d]), mvp, screen_width, screen_height
+            )
+            starts, ends, visible = liang_barsky_batch(screen[:count], screen[count:], *clip_bounds)
+        
+        # Filter out very short lines, comparing squared lengths to skip the sqrt
+        deltas = ends - starts
+        min_length_sq = self.config.min_line_length ** 2
+        keep = visible & (np.einsum("ij,ij->i", deltas, deltas) >= min_length_sq)
+        
+        batch = GridLineBatch(
+            starts=starts[keep],
+            ends=ends[keep],
+            panel_ids=panel_ids[keep],
+            line_types=line_types[keep],
+            panel_labels=tuple(panel.label for panel in panels)
+        )
         
-        return filtered_lines
+        # The batch is memoized and handed to every caller, so lock its arrays
+        for array in (batch.starts, batch.ends, batch.panel_ids, batch.line_types):
+            array.setflags(write=False)
+        return batch
     
-    def _generate_panel_grid(self, panel: Panel, view_matrix, projection_matrix,
-                            screen_width: int, screen_height: int) -> List[GridLine]:
-        """Generate grid lines for a single panel."""
-        lines = []
+    def _generate_panel_grid(self, panel: Panel, grid_spacing: float) -> List[_LineFamily]:
+        """Describe the 3D grid lines for a single panel."""
+        families = []
         
         # Add panel boundary if requested
         if self.config.show_panel_boundaries:
-            boundary_lines = self._generate_panel_boundary(
-                panel, view_matrix, projection_matrix, screen_width, screen_height
-            )
-            lines.extend(boundary_lines)
+            families.extend(self._generate_panel_boundary(panel))
         
         # Generate interior grid lines
-        interior_lines = self._generate_interior_grid(
-            panel, view_matrix, projection_matrix, screen_width, screen_height
-        )
-        lines.extend(interior_lines)
+        families.extend(self._generate_interior_grid(panel, grid_spacing))
         
-        return lines
+        return families
     
-    def _generate_panel_boundary(self, panel: Panel, view_matrix, projection_matrix,
-                                screen_width: int, screen_height: int) -> List[GridLine]:
+    def _generate_panel_boundary(self, panel: Panel) -> List[_LineFamily]:
         """Generate boundary lines for a panel."""
-        lines = []
-        corners = panel.corners
+        corners = panel.corners_array
         
         if len(corners) != 4:
-            return lines
+            return []
         
         # Create lines between adjacent corners
-        for i in range(4):
-            start_3d = corners[i]
-            end_3d = corners[(i + 1) % 4]
-            
-            # Project and clip line
-            line = self._project_and_clip_line(
-                start_3d, end_3d, view_matrix, projection_matrix,
-                screen_width, screen_height, panel.label, "boundary"
-            )
-            
-            if line:
-                lines.append(line)
-        
-        return lines
+        return [_LineFamily(corners, np.roll(corners, -1, axis=0), _BOUNDARY)]
     
-    def _generate_interior_grid(self, panel: Panel, view_matrix, projection_matrix,
-                               screen_width: int, screen_height: int) -> List[GridLine]:
+    # Axes each panel's grid spans, as (u_axis, v_axis) coordinate indices:
+    # horizontal lines run along corner 0 -> 1 (u) and are spaced along v,
+    # vertical lines run along corner 0 -> 3 (v) and are spaced along u.
+    # Floor: X by Z; walls: width by Y, where the left wall runs along Z.
+    _GRID_AXES_BY_TYPE = {"floor": (0, 2), "wall": (0, 1)}
+    _GRID_AXES_BY_LABEL = {("wall", "Left Wall"): (2, 1)}
+    
+    def _generate_interior_grid(self, panel: Panel, grid_spacing: float) -> List[_LineFamily]:
         """Generate interior grid lines for a panel."""
-        lines = []
-        
         if len(panel.corners) != 4:
-            return lines
-        
-        # Determine panel orientation and generate appropriate grid
-        if panel.panel_type == "floor":
-            lines.extend(self._generate_floor_grid(
-                panel, view_matrix, projection_matrix, screen_width, screen_height
-            ))
-        elif panel.panel_type == "wall":
-            lines.extend(self._generate_wall_grid(
-                panel, view_matrix, projection_matrix, screen_width, screen_height
-            ))
-        
-        return lines
-    
-    def _generate_floor_grid(self, panel: Panel, view_matrix, projection_matrix,
-                            screen_width: int, screen_height: int) -> List[GridLine]:
-        """Generate uniform square grid for floor panel."""
-        lines = []
-        corners = panel.corners
-        
-        # Floor corners: [origin, right_edge, far_right, far_left]
-        origin = corners[0]      # (0, 0, 0)
-        right_edge = corners[1]  # (width, 0, 0)  
-        far_right = corners[2]   # (width, 0, depth)
-        far_left = corners[3]    # (0, 0, depth)
-        
-        # Calculate dimensions
-        width = abs(right_edge.x - origin.x)
-        depth = abs(far_left.z - origin.z)
-        
-        # Use consistent square grid spacing
-        grid_spacing = self._calculate_grid_spacing(min(width, depth))
-        
-        # Generate horizontal lines (parallel to X-axis, spaced in Z direction)
-        num_z_lines = int(depth / grid_spacing)
-        for i in range(1, num_z_lines):  # Skip boundaries, start from 1
-            z_pos = origin.z + (i * grid_spacing)
-            if z_pos >= far_left.z:
-                break
-                
-            start_3d = Point3D(origin.x, origin.y, z_pos)
-            end_3d = Point3D(right_edge.x, origin.y, z_pos)
-            
-            line = self._project_and_clip_line(
-                start_3d, end_3d, view_matrix, projection_matrix,
-                screen_width, screen_height, panel.label, "horizontal"
-            )
-            
-            if line:
-                lines.append(line)
-        
-        # Generate vertical lines (parallel to Z-axis, spaced in X direction)
-        num_x_lines = int(width / grid_spacing)
-        for i in range(1, num_x_lines):  # Skip boundaries, start from 1
-            x_pos = origin.x + (i * grid_spacing)
-            if x_pos >= right_edge.x:
-                break
-                
-            start_3d = Point3D(x_pos, origin.y, origin.z)
-            end_3d = Point3D(x_pos, origin.y, far_left.z)
-            
-            line = self._project_and_clip_line(
-                start_3d, end_3d, view_matrix, projection_matrix,
-                screen_width, screen_height, panel.label, "vertical"
-            )
-            
-            if line:
-                lines.append(line)
-        
-        return lines
-    
-    def _generate_wall_grid(self, panel: Panel, view_matrix, projection_matrix,
-                           screen_width: int, screen_height: int) -> List[GridLine]:
-        """Generate uniform square grid for wall panels."""
-        lines = []
-        corners = panel.corners
+            return []
         
-        # Wall corners: [near-bottom, far-bottom, far-top, near-top]
-        near_bottom = corners[0]
-        far_bottom = corners[1]
-        far_top = corners[2]
-        near_top = corners[3]
-        
-        # Calculate dimensions
-        if panel.label == "Left Wall":
-            # Left wall: varies in Z (depth) and Y (height)
-            width = abs(far_bottom.z - near_bottom.z)
-            height = abs(near_top.y - near_bottom.y)
-        else:  # Right Wall
-            # Right wall: varies in X (width) and Y (height)
-            width = abs(far_bottom.x - near_bottom.x)
-            height = abs(near_top.y - near_bottom.y)
+        # Determine panel orientation once with table lookups
+        axes = self._GRID_AXES_BY_TYPE.get(panel.panel_type)
+        if axes is None:
+            return []
+        u_axis, v_axis = self._GRID_AXES_BY_LABEL.get((panel.panel_type, panel.label), axes)
         
-        # Skip panels with zero dimensions
-        if width == 0 or height == 0:
-            return lines
-        
-        # Use same square grid spacing as floor
-        grid_spacing = self._calculate_grid_spacing(min(width, height))
-        
-        # Generate horizontal lines (constant height) - same spacing as floor
-        num_h_lines = int(height / grid_spacing)
-        for i in range(1, num_h_lines):  # Skip boundaries
-            y_pos = near_bottom.y + (i * grid_spacing)
-            if y_pos >= near_top.y:
-                break
-            
-            if panel.label == "Left Wall":
-                start_3d = Point3D(near_bottom.x, y_pos, near_bottom.z)
-                end_3d = Point3D(far_bottom.x, y_pos, far_bottom.z)
-            else:  # Right Wall
-                start_3d = Point3D(near_bottom.x, y_pos, near_bottom.z)
-                end_3d = Point3D(far_bottom.x, y_pos, far_bottom.z)
-            
-            line = self._project_and_clip_line(
-                start_3d, end_3d, view_matrix, projection_matrix,
-                screen_width, screen_height, panel.label, "horizontal"
-            )
-            
-            if line:
-                lines.append(line)
-        
-        # Generate vertical lines - same spacing as floor
-        num_v_lines = int(width / grid_spacing)
-        for i in range(1, num_v_lines):  # Skip boundaries
-            if panel.label == "Left Wall":
-                z_pos = near_bottom.z + (i * grid_spacing)
-                if z_pos >= far_bottom.z:
-                    break
-                start_3d = Point3D(near_bottom.x, near_bottom.y, z_pos)
-                end_3d = Point3D(near_top.x, near_top.y, z_pos)
-            else:  # Right Wall
-                x_pos = near_bottom.x + (i * grid_spacing)
-                if x_pos >= far_bottom.x:
-                    break
-                start_3d = Point3D(x_pos, near_bottom.y, near_bottom.z)
-                end_3d = Point3D(x_pos, near_top.y, near_top.z)
-            
-            line = self._project_and_clip_line(
-                start_3d, end_3d, view_matrix, projection_matrix,
-                screen_width, screen_height, panel.label, "vertical"
-            )
-            
-            if line:
-                lines.append(line)
-        
-        return lines
+        return self._generate_surface_grid(panel, grid_spacing, u_axis, v_axis)
     
-    def _calculate_grid_spacing(self, dimension: float) -> float:
-        """Calculate much larger grid spacing for clean, readable squares."""
-        # Create much larger grid squares like the reference image
-        # Base square size should be much bigger - around 24 inches for clean appearance
-        base_square_size = 24.0  # Large squares for clean grid
-        
-        # Adjust by density (keep density effect minimal for consistency)
-        square_size = base_square_size / max(0.5, self.config.density)
-        
-        return square_size
-    
-    def _clip_line_to_viewport(self, start: Point2D, end: Point2D, 
-                              screen_width: int, screen_height: int) -> tuple[Point2D, Point2D] | None:
+    def _generate_surface_grid(self, panel: Panel, grid_spacing: float,
+                               u_axis: int, v_axis: int) -> List[_LineFamily]:
         """
-        Clip a line to the viewport bounds using Cohen-Sutherland algorithm.
+        Generate a uniform square grid over an axis-aligned panel.
         
         Args:
-            start: Start point of the line
-            end: End point of the line
-            screen_width: Width of the viewport
-            screen_height: Height of the viewport
+            panel: Floor or wall panel
+            grid_spacing: Grid square size in panel units
+            u_axis: Coordinate index along corner 0 -> 1
+            v_axis: Coordinate index along corner 0 -> 3
             
         Returns:
-            Tuple of clipped start and end points, or None if line is completely outside
-        """
-        # Define viewport with margin for better visual results
-        margin = max(screen_width, screen_height) * 0.5  # 50% margin
-        x_min = -margin
-        y_min = -margin
-        x_max = screen_width + margin
-        y_max = screen_height + margin
-        
-        # Cohen-Sutherland region codes
-        def compute_code(x: float, y: float) -> int:
-            code = 0
-            if x < x_min:
-                code |= 1  # Left
-            elif x > x_max:
-                code |= 2  # Right
-            if y < y_min:
-                code |= 4  # Bottom
-            elif y > y_max:
-                code |= 8  # Top
-            return code
-        
-        x1, y1 = start.x, start.y
-        x2, y2 = end.x, end.y
-        
-        code1 = compute_code(x1, y1)
-        code2 = compute_code(x2, y2)
-        
-        while True:
-            # Both points inside
-            if code1 == 0 and code2 == 0:
-                return Point2D(x1, y1), Point2D(x2, y2)
-            
-            # Both points in same outside region
-            if code1 & code2 != 0:
-                return None
-            
-            # At least one point outside, pick one
-            code = code1 if code1 != 0 else code2
-            
-            # Find intersection with boundary
-            if code & 8:  # Top
-                x = x1 + (x2 - x1) * (y_max - y1) / (y2 - y1)
-                y = y_max
-            elif code & 4:  # Bottom
-                x = x1 + (x2 - x1) * (y_min - y1) / (y2 - y1)
-                y = y_min
-            elif code & 2:  # Right
-                y = y1 + (y2 - y1) * (x_max - x1) / (x2 - x1)
-                x = x_max
-            elif code & 1:  # Left
-                y = y1 + (y2 - y1) * (x_min - x1) / (x2 - x1)
-                x = x_min
-            
-            # Update point and code
-            if code == code1:
-                x1, y1 = x, y
-                code1 = compute_code(x1, y1)
-            else:
-                x2, y2 = x, y
-                code2 = compute_code(x2, y2)
-    
-    def _project_and_clip_line(self, start_3d: Point3D, end_3d: Point3D,
-                              view_matrix, projection_matrix, 
-                              screen_width: int, screen_height: int,
-                              panel_label: str, line_type: str) -> GridLine | None:
+            Horizontal and vertical line families for the panel
         """
-        Project a 3D line to 2D and clip to viewport, returning a GridLine or None.
+        # Floor corners: [origin, right_edge, far_right, far_left]
+        # Wall corners: [near-bottom, far-bottom, far-top, near-top]
+        origin, u_edge, _, v_edge = panel.corners_array
         
-        Args:
-            start_3d: 3D start point
-            end_3d: 3D end point
-            view_matrix: Camera view matrix
-            projection_matrix: Camera projection matrix
-            screen_width: Screen width in pixels
-            screen_height: Screen height in pixels
-            panel_label: Label for the panel this line belongs to
-            line_type: Type of line ("boundary", "horizontal", "vertical")
-            
-        Returns:
-            GridLine if line is visible after clipping, None otherwise
-        """
-        # Project to screen coordinates
-        start_2d = project_to_screen(
-            start_3d, view_matrix, projection_matrix, screen_width, screen_height
-        )
-        end_2d = project_to_screen(
-            end_3d, view_matrix, projection_matrix, screen_width, screen_height
-        )
+        u_delta = u_edge[u_axis] - origin[u_axis]
+        v_delta = v_edge[v_axis] - origin[v_axis]
         
-        # Clip to viewport
-        clipped = self._clip_line_to_viewport(start_2d, end_2d, screen_width, screen_height)
+        # Skip panels with zero dimensions
+        if u_delta == 0 or v_delta == 0:
+            return []
         
-        if clipped:
-            return GridLine(clipped[0], clipped[1], panel_label, line_type)
-        return None
-    
-    def _calculate_line_length(self, line: GridLine) -> float:
-        """Calculate the length of a line in pixels."""
-        dx = line.end.x - line.start.x
-        dy = line.end.y - line.start.y
-        return np.sqrt(dx*dx + dy*dy)
+        # Step toward the far edge so panels whose corners run in reverse
+        # order still get lines inside their extent
+        u_step = np.copysign(grid_spacing, u_delta)
+        v_step = np.copysign(grid_spacing, v_delta)
+        
+        # Horizontal lines (parallel to u, spaced along v), skipping boundaries
+        v_positions = origin[v_axis] + np.arange(1, int(abs(v_delta) / grid_spacing)) * v_step
+        horizontal = _LineFamily(origin, u_edge, _HORIZONTAL, v_axis, v_positions)
+        
+        # Vertical lines (parallel to v, spaced along u), skipping boundaries
+        u_positions = origin[u_axis] + np.arange(1, int(abs(u_delta) / grid_spacing)) * u_step
+        vertical = _LineFamily(origin, v_edge, _VERTICAL, u_axis, u_positions)
+        
+        return [horizontal, vertical]
     
-    def get_grid_stats(self, lines: List[GridLine]) -> Dict[str, Any]:
+    def get_grid_stats(self, lines: Union[List[GridLine], GridLineBatch]) -> Dict[str, Any]:
         """
         Get statistics about the generated grid.
         
         Args:
-            lines: List of generated grid lines
+            lines: Generated grid lines, as a list or a GridLineBatch
             
         Returns:
             Dictionary with grid statistics
         """
-        if not lines:
+        if not len(lines):
             return {"total_lines": 0, "panels": {}}
         
-        stats = {
+        if isinstance(lines, GridLineBatch):
+            codes = lines.line_types
+            panel_ids, panel_counts = _count_in_order(lines.panel_ids)
+            panel_labels = [lines.panel_labels[panel_id] for panel_id in panel_ids]
+        else:
+            codes = np.fromiter(
+                (_LINE_TYPE_CODES[line.line_type] for line in lines), dtype=np.uint8, count=len(lines)
+            )
+            panel_labels, panel_counts = _count_in_order(
+                np.array([line.panel_label for line in lines])
+            )
+        
+        # Count lines by type with one bincount over their integer codes
+        type_counts = np.bincount(codes, minlength=len(LINE_TYPES)).tolist()
+        
+        # Count lines by panel; distinct panels may share a label
+        panels = {}
+        for label, count in zip(panel_labels, panel_counts):
+            panels[label] = panels.get(label, 0) + count
+        
+        return {
             "total_lines": len(lines),
-            "panels": {},
-            "line_types": {"horizontal": 0, "vertical": 0, "boundary": 0}
+            "panels": panels,
+            "line_types": {line_type.value: count for line_type, count in zip(LINE_TYPES, type_counts)}
         }
+
+
+def liang_barsky_batch(starts: np.ndarray, ends: np.ndarray, x_min: float, y_min: float,
+                       x_max: float, y_max: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clip a batch of 2D lines to a rectangle using the Liang-Barsky algorithm.
+    
+    Args:
+        starts: (N, 2) array of line start points
+        ends: (N, 2) array of line end points
+        x_min: Left edge of the clip rectangle
+        y_min: Top edge of the clip rectangle
+        x_max: Right edge of the clip rectangle
+        y_max: Bottom edge of the clip rectangle
+        
+    Returns:
+        Tuple of clipped (N, 2) start and end arrays and an (N,) boolean mask
+        of lines that are at least partly inside the rectangle. Endpoints of
+        lines outside the rectangle are left unclipped.
+    """
+    # Clip in the input precision (float32 or float64)
+    dtype = np.result_type(starts.dtype, ends.dtype, np.float32)
+    clipped_starts = np.array(starts, dtype=dtype)
+    clipped_ends = np.array(ends, dtype=dtype)
+    
+    # Only lines that cross an edge need the parametric clip: lines with both
+    # endpoints inside are accepted as-is, and lines with both endpoints
+    # beyond the same edge are rejected
+    bounds = (x_min, y_min, x_max, y_max)
+    start_codes = outcodes(starts, *bounds)
+    end_codes = outcodes(ends, *bounds)
+    visible = (start_codes & end_codes) == 0
+    
+    rows = np.flatnonzero(visible & ((start_codes | end_codes) != 0))
+    if len(rows):
+        clipped_starts[rows], clipped_ends[rows], visible[rows] = _liang_barsky(
+            clipped_starts[rows], clipped_ends[rows], *bounds
+        )
+    
+    return clipped_starts, clipped_ends, visible
+
+
+def outcodes(points: np.ndarray, x_min: float, y_min: float,
+             x_max: float, y_max: float) -> np.ndarray:
+    """
+    Compute Cohen-Sutherland region codes for a batch of 2D points.
+    
+    Args:
+        points: (N, 2) array of points
+        x_min: Left edge of the clip rectangle
+        y_min: Top edge of the clip rectangle
+        x_max: Right edge of the clip rectangle
+        y_max: Bottom edge of the clip rectangle
+        
+    Returns:
+        (N,) uint8 array with bit 0 = left, 1 = right, 2 = top, 3 = bottom
+    """
+    x = points[:, 0]
+    y = points[:, 1]
+    
+    # Branchless bit packing of the four edge comparisons
+    return ((x < x_min).view(np.uint8)
+            | ((x > x_max).view(np.uint8) << 1)
+            | ((y < y_min).view(np.uint8) << 2)
+            | ((y > y_max).view(np.uint8) << 3))
+
+
+def _liang_barsky(starts: np.ndarray, ends: np.ndarray, x_min: float, y_min: float,
+                  x_max: float, y_max: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parametric Liang-Barsky clip of every line in the batch."""
+    deltas = ends - starts
+    dx = deltas[:, 0]
+    dy = deltas[:, 1]
+    
+    # Parametric edge tests: p * t <= q for the left, right, top and bottom edges
+    p = np.stack([-dx, dx, -dy, dy], axis=1)
+    q = np.stack([
+        starts[:, 0] - x_min,
+        x_max - starts[:, 0],
+        starts[:, 1] - y_min,
+        y_max - starts[:, 1]
+    ], axis=1)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = q / p
+    
+    # Entering edges raise the start parameter, leaving edges lower the end one
+    t_enter = np.max(np.where(p < 0, ratios, 0.0), axis=1, initial=0.0)
+    t_exit = np.min(np.where(p > 0, ratios, 1.0), axis=1, initial=1.0)
+    
+    # Lines parallel to an edge and outside it can never be visible
+    outside_parallel = ((p == 0) & (q < 0)).any(axis=1)
+    visible = ~outside_parallel & (t_enter <= t_exit)
+    
+    # Measure the end cut back from the original end so unclipped ends stay exact
+    clipped_starts = starts + t_enter[:, None] * deltas
+    clipped_ends = ends - (1.0 - t_exit)[:, None] * deltas
+    
+    return clipped_starts, clipped_ends, visible
+
+
+def _count_in_order(values: np.ndarray) -> Tuple[list, list]:
+    """
+    Count distinct values, keeping the order in which they first appear.
+    
+    Args:
+        values: (N,) array of hashable, sortable values
         
-        # Count lines by panel and type
-        for line in lines:
-            panel_label = line.panel_label
-            line_type = line.line_type
-            
-            if panel_label not in stats["panels"]:
-                stats["panels"][panel_label] = 0
-            
-            stats["panels"][panel_label] += 1
-            stats["line_types"][line_type] += 1
-        
-        return stats
+    Returns:
+        Tuple of (distinct values, counts) as lists
+    """
+    distinct, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+    
+    # np.unique sorts its output; restore first-appearance order
+    order = np.argsort(first_index)
+    return distinct[order].tolist(), counts[order].tolist()
+
+
+def _grid_spacing(density: float) -> float:
+    """
+    Calculate much larger grid spacing for clean, readable squares.
+    
+    Every panel uses the same square size so grids line up across panels.
+    
+    Args:
+        density: Grid density from GridConfig
+        
+    Returns:
+        Grid square size in panel units
+    """
+    # Create much larger grid squares like the reference image
+    # Base square size should be much bigger - around 24 inches for clean appearance
+    base_square_size = 24.0  # Large squares for clean grid
+    
+    # Adjust by density (keep density effect minimal for consistency)
+    return base_square_size / max(0.5, density)
+
+
+def _panel_in_view(corners: np.ndarray, mvp: np.ndarray, screen_width: int,
+                   screen_height: int, clip_bounds: Tuple[float, float, float, float]) -> bool:
+    """
+    Check whether a panel can contribute any lines inside the clip rectangle.
+    
+    Args:
+        corners: (N, 3) array of panel corners
+        mvp: Combined projection @ view matrix
+        screen_width: Screen width in pixels
+        screen_height: Screen height in pixels
+        clip_bounds: Clip rectangle as (x_min, y_min, x_max, y_max)
+        
+    Returns:
+        False if the panel's projected bounding box misses the clip
+        rectangle, True otherwise
+    """
+    if len(corners) == 0:
+        return False
+    
+    # When every corner has clip-space w of the same sign, w never crosses
+    # zero inside the flat panel, so the panel projects inside the bounding
+    # box of its projected corners. Otherwise that box proves nothing.
+    w = corners @ mvp[3, :3] + mvp[3, 3]
+    if not (np.all(w > 0) or np.all(w < 0)):
+        return True
+    
+    screen = project_points_to_screen(corners, mvp, screen_width, screen_height)
+    x_min, y_min, x_max, y_max = clip_bounds
+    (min_x, min_y), (max_x, max_y) = screen.min(axis=0), screen.max(axis=0)
+    return min_x <= x_max and max_x >= x_min and min_y <= y_max and max_y >= y_min
+
+
+def _clip_bounds(screen_width: int, screen_height: int) -> Tuple[float, float, float, float]:
+    """
+    Get the clip rectangle for a viewport.
+    
+    Args:
+        screen_width: Width of the viewport
+        screen_height: Height of the viewport
+        
+    Returns:
+        Tuple of (x_min, y_min, x_max, y_max)
+    """
+    # Define viewport with margin for better visual results
+    margin = max(screen_width, screen_height) * 0.5  # 50% margin
+    return -margin, -margin, screen_width + margin, screen_height + margin
@@ -4,21 +4,43 @@
 This module handles the mathematical foundations for 3D to 2D perspective projection.
 """
 
+import math
 import numpy as np
 from typing import Tuple, List
 from dataclasses import dataclass
 
 
-@dataclass
+# Exact (cos, sin) for quarter turns, where math.cos/sin leave ~1e-16 residue
+_QUARTER_TURNS = {
+    0.0: (1.0, 0.0),
+    math.pi / 2: (0.0, 1.0),
+    math.pi: (-1.0, 0.0),
+    3 * math.pi / 2: (0.0, -1.0),
+    -math.pi / 2: (0.0, -1.0),
+}
+
+
+@dataclass(slots=True)
 class Point3D:
     """Represents a point in 3D space."""
     x: float
     y: float
     z: float
     
-    def to_array(self) -> np.ndarray:
-        """Convert to numpy array for calculations."""
-        return np.array([self.x, self.y, self.z, 1.0])
+    def to_array(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert to a homogeneous numpy array for calculations.
+        
+        Args:
+            out: Optional length-4 array to fill instead of allocating a new one
+            
+        Returns:
+            Array of [x, y, z, 1.0]; out itself when given
+        """
+        if out is None:
+            return np.array([self.x, self.y, self.z, 1.0])
+        out[:] = (self.x, self.y, self.z, 1.0)
+        return out
     
     @classmethod
     def from_array(cls, arr: np.ndarray) -> 'Point3D':
@@ -26,14 +48,14 @@ class Point3D:
         return cls(arr[0], arr[1], arr[2])
 
 
-@dataclass
+@dataclass(slots=True)
 class Point2D:
     """Represents a point in 2D screen space."""
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector3D:
     """Represents a 3D vector."""
     x: float
@@ -42,7 +64,7 @@ class Vector3D:
     
     def normalize(self) -> 'Vector3D':
         """Return normalized vector."""
-        length = np.sqrt(self.x**2 + self.y**2 + self.z**2)
+        length = math.sqrt(self.x**2 + self.y**2 + self.z**2)
         if length == 0:
             return Vector3D(0, 0, 0)
         return Vector3D(self.x/length, self.y/length, self.z/length)
@@ -63,6 +85,8 @@ class Vector3D:
 class Matrix4x4:
     """4x4 transformation matrix for 3D operations."""
     
+    _IDENTITY = None  # Shared read-only instance returned by identity()
+    
     def __init__(self, matrix: np.ndarray = None):
         """Initialize with identity matrix if none provided."""
         if matrix is None:
@@ -72,8 +96,17 @@ class Matrix4x4:
     
     @classmethod
     def identity(cls) -> 'Matrix4x4':
-        """Create identity matrix."""
-        return cls()
+        """
+        Get the identity matrix.
+        
+        The instance is shared between callers, so its array is read-only;
+        use Matrix4x4() for an identity matrix that can be modified in place.
+        """
+        if cls._IDENTITY is None:
+            identity = cls()
+            identity.matrix.setflags(write=False)
+            cls._IDENTITY = identity
+        return cls._IDENTITY
     
     @classmethod
     def translation(cls, x: float, y: float, z: float) -> 'Matrix4x4':
@@ -87,8 +120,13 @@ class Matrix4x4:
     @classmethod
     def rotation_y(cls, angle_radians: float) -> 'Matrix4x4':
         """Create rotation matrix around Y axis."""
-        cos_a = np.cos(angle_radians)
-        sin_a = np.sin(angle_radians)
+        # float() so NumPy scalars and 0-d arrays can be looked up too
+        quarter_turn = _QUARTER_TURNS.get(float(angle_radians))
+        if quarter_turn is not None:
+            cos_a, sin_a = quarter_turn
+        else:
+            cos_a = math.cos(angle_radians)
+            sin_a = math.sin(angle_radians)
         matrix = np.array([
             [cos_a, 0, sin_a, 0],
             [0, 1, 0, 0],
@@ -100,7 +138,7 @@ class Matrix4x4:
     @classmethod
     def perspective(cls, fov_radians: float, aspect_ratio: float, near: float, far: float) -> 'Matrix4x4':
         """Create perspective projection matrix."""
-        f = 1.0 / np.tan(fov_radians / 2.0)
+        f = 1.0 / math.tan(fov_radians / 2.0)
         matrix = np.array([
             [f / aspect_ratio, 0, 0, 0],
             [0, f, 0, 0],
@@ -140,14 +178,48 @@ class Matrix4x4:
     
     def transform_point(self, point: Point3D) -> Point3D:
         """Transform a 3D point."""
-        point_array = point.to_array()
-        transformed = self.matrix @ point_array
+        # Plain scalar math: for a single point this beats building a
+        # homogeneous ndarray and dispatching a 4x4 matmul
+        (m00, m01, m02, m03), (m10, m11, m12, m13), \
+            (m20, m21, m22, m23), (m30, m31, m32, m33) = self.matrix.tolist()
+        x, y, z = point.x, point.y, point.z
+        
+        tx = m00 * x + m01 * y + m02 * z + m03
+        ty = m10 * x + m11 * y + m12 * z + m13
+        tz = m20 * x + m21 * y + m22 * z + m23
+        w = m30 * x + m31 * y + m32 * z + m33
         
         # Handle perspective division
-        if transformed[3] != 0:
-            transformed = transformed / transformed[3]
+        if w != 0:
+            tx, ty, tz = tx / w, ty / w, tz / w
         
-        return Point3D.from_array(transformed)
+        return Point3D(tx, ty, tz)
+    
+    def transform_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Transform a batch of 3D points.
+        
+        Vectorized counterpart of transform_point: one matrix product for
+        all points, then the same perspective division.
+        
+        Args:
+            points: (N, 3) array of 3D points
+            
+        Returns:
+            (N, 3) array of transformed points, float32 for float32 input and
+            float64 otherwise
+        """
+        # Stay in float32 when given float32 points; everything else is float64
+        dtype = np.result_type(np.asarray(points).dtype, np.float32)
+        points = np.asarray(points, dtype=dtype).reshape(-1, 3)
+        matrix = self.matrix.astype(dtype, copy=False)
+        
+        # Homogeneous transform without materializing a column of ones
+        transformed = points @ matrix[:, :3].T + matrix[:, 3]
+        
+        # Perspective division, skipped where w == 0 as in transform_point
+        w = transformed[:, 3:]
+        return transformed[:, :3] / np.where(w != 0, w, 1.0)
 
 
 def project_to_screen(point_3d: Point3D, view_matrix: Matrix4x4, 
@@ -156,6 +228,9 @@ def project_to_screen(point_3d: Point3D, view_matrix: Matrix4x4,
     """
     Project a 3D point to 2D screen coordinates.
     
+    Convenience path for a single point. Projecting many points this way is
+    slow; use project_points_to_screen with the combined matrix instead.
+    
     Args:
         point_3d: 3D point to project
         view_matrix: Camera view transformation matrix
@@ -179,11 +254,52 @@ def project_to_screen(point_3d: Point3D, view_matrix: Matrix4x4,
     return Point2D(screen_x, screen_y)
 
 
+def project_points_to_screen(points: np.ndarray, matrix, screen_width: int,
+                             screen_height: int) -> np.ndarray:
+    """
+    Project a batch of 3D points to 2D screen coordinates.
+    
+    Vectorized counterpart of project_to_screen that takes the combined
+    projection @ view matrix, so every point costs one matrix product.
+    
+    Args:
+        points: (N, 3) array of 3D points
+        matrix: Combined projection @ view matrix (Matrix4x4 or 4x4 array)
+        screen_width: Screen width in pixels
+        screen_height: Screen height in pixels
+    
+    Returns:
+        (N, 2) array of screen coordinates, float32 for float32 input and
+        float64 otherwise
+    """
+    if isinstance(matrix, Matrix4x4):
+        matrix = matrix.matrix
+    
+    # Stay in float32 when given float32 points; everything else is float64
+    dtype = np.result_type(np.asarray(points).dtype, np.float32)
+    points = np.asarray(points, dtype=dtype).reshape(-1, 3)
+    matrix = np.asarray(matrix, dtype=dtype)
+    
+    # Homogeneous transform without materializing a column of ones
+    clip = points @ matrix[:, :3].T + matrix[:, 3]
+    
+    # Perspective division, skipped where w == 0 as in Matrix4x4.transform_point
+    w = clip[:, 3]
+    w = np.where(w != 0, w, 1.0)
+    
+    # Convert normalized device coordinates to screen coordinates
+    screen = np.empty((len(points), 2), dtype=dtype)
+    screen[:, 0] = (clip[:, 0] / w + 1.0) * 0.5 * screen_width
+    screen[:, 1] = (1.0 - clip[:, 1] / w) * 0.5 * screen_height  # Flip Y axis
+    
+    return screen
+
+
 def degrees_to_radians(degrees: float) -> float:
-    """Convert degrees to radians."""
-    return degrees * np.pi / 180.0
+    """Convert degrees to radians; also works element-wise on numpy arrays."""
+    return degrees * math.pi / 180.0
 
 
 def radians_to_degrees(radians: float) -> float:
-    """Convert radians to degrees."""
-    return radians * 180.0 / np.pi
+    """Convert radians to degrees; also works element-wise on numpy arrays."""
+    return radians * 180.0 / math.pi
@@ -5,11 +5,12 @@ This module creates scalable vector graphics output of the generated grids.
 """
 
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any, Optional
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple, Union, NamedTuple
 from dataclasses import dataclass
 from pathlib import Path
 
-from perspective.grid_generator import GridLine
+from perspective.grid_generator import GridLine, GridLineBatch, LINE_TYPES, LineType
 
 
 @dataclass
@@ -32,6 +33,7 @@ class SVGConfig:
     show_labels: bool = True
     label_font_size: int = 14
     label_font_family: str = "Arial, sans-serif"
+    view_box: Optional[Tuple[int, int]] = None  # Grid coordinate size; defaults to width/height
     
     def __post_init__(self):
         """Set default styles if not provided."""
@@ -57,13 +59,13 @@ class SVGRenderer:
         """
         self.config = config or SVGConfig()
     
-    def render(self, grid_lines: List[GridLine], output_path: str,
+    def render(self, grid_lines: Union[List[GridLine], GridLineBatch], output_path: str,
                title: str = "Perspective Grid") -> bool:
         """
         Render grid lines to SVG file.
         
         Args:
-            grid_lines: List of grid lines to render
+            grid_lines: Grid lines to render, as a list or a GridLineBatch
             output_path: Path to save SVG file
             title: Title for the SVG document
             
@@ -71,24 +73,10 @@ class SVGRenderer:
             True if successful, False otherwise
         """
         try:
-            # Create SVG root element
-            svg_root = self._create_svg_root(title)
-            
-            # Add background
-            self._add_background(svg_root)
-            
-            # Group lines by type for organized output
-            grouped_lines = self._group_lines_by_type(grid_lines)
-            
-            # Add grid lines
-            self._add_grid_lines(svg_root, grouped_lines)
-            
-            # Add panel labels if requested
-            if self.config.show_labels:
-                self._add_panel_labels(svg_root, grid_lines)
+            document = self._build_document(grid_lines, title)
             
             # Write to file
-            self._write_svg_file(svg_root, output_path)
+            self._write_svg_file(document, output_path)
             
             return True
             
@@ -96,13 +84,56 @@ class SVGRenderer:
             print(f"Error rendering SVG: {e}")
             return False
     
+    def render_to_string(self, grid_lines: Union[List[GridLine], GridLineBatch],
+                         title: str = "Perspective Grid") -> str:
+        """
+        Render grid lines to an SVG document without writing a file.
+        
+        Produces exactly the text render() writes. Unlike render(), errors
+        are raised rather than reported.
+        
+        Args:
+            grid_lines: Grid lines to render, as a list or a GridLineBatch
+            title: Title for the SVG document
+            
+        Returns:
+            SVG document, including the XML declaration
+        """
+        return self._build_document(grid_lines, title).decode('utf-8')
+    
+    def _build_document(self, grid_lines: Union[List[GridLine], GridLineBatch],
+                        title: str) -> bytes:
+        """Build the complete UTF-8 encoded SVG document."""
+        # Work on parallel arrays rather than per-line objects
+        lines = _RenderLines.from_grid_lines(grid_lines)
+        
+        # Create SVG root element
+        svg_root = self._create_svg_root(title)
+        
+        # Add background
+        self._add_background(svg_root)
+        
+        # Add grid lines, grouped by type for organized output
+        self._add_grid_lines(svg_root, lines)
+        
+        # Add panel labels if requested
+        if self.config.show_labels:
+            self._add_panel_labels(svg_root, lines)
+        
+        # Format the XML nicely
+        self._indent_xml(svg_root)
+        
+        # Serialize once, with declaration
+        return b'<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(svg_root, encoding='utf-8')
+    
     def _create_svg_root(self, title: str) -> ET.Element:
         """Create the root SVG element with proper attributes."""
         svg = ET.Element("svg")
         svg.set("xmlns", "http://www.w3.org/2000/svg")
         svg.set("width", str(self.config.width))
         svg.set("height", str(self.config.height))
-        svg.set("viewBox", f"0 0 {self.config.width} {self.config.height}")
+        view_width, view_height = self._get_view_size()
+        svg.set("viewBox", f"0 0 {view_width} {view_height}")
         
         # Add title
         title_elem = ET.SubElement(svg, "title")
@@ -114,41 +145,43 @@ class SVGRenderer:
         
         return svg
     
+    def _get_view_size(self) -> Tuple[int, int]:
+        """
+        Get the size of the coordinate space the grid lines are in.
+        
+        The SVG scales this space to the output width and height, so a grid
+        generated for one resolution renders losslessly at any other size
+        with the same aspect ratio.
+        
+        Returns:
+            Tuple of (width, height) in grid coordinates
+        """
+        return self.config.view_box or (self.config.width, self.config.height)
+    
     def _add_background(self, svg_root: ET.Element):
         """Add background rectangle."""
         bg = ET.SubElement(svg_root, "rect")
         bg.set("x", "0")
         bg.set("y", "0")
-        bg.set("width", str(self.config.width))
-        bg.set("height", str(self.config.height))
+        view_width, view_height = self._get_view_size()
+        bg.set("width", str(view_width))
+        bg.set("height", str(view_height))
         bg.set("fill", self.config.background_color)
     
-    def _group_lines_by_type(self, grid_lines: List[GridLine]) -> Dict[str, List[GridLine]]:
-        """Group grid lines by type for organized rendering."""
-        groups = {
-            "boundary": [],
-            "horizontal": [],
-            "vertical": []
-        }
-        
-        for line in grid_lines:
-            line_type = line.line_type
-            if line_type in groups:
-                groups[line_type].append(line)
-        
-        return groups
-    
-    def _add_grid_lines(self, svg_root: ET.Element, grouped_lines: Dict[str, List[GridLine]]):
+    def _add_grid_lines(self, svg_root: ET.Element, lines: '_RenderLines'):
         """Add all grid lines to SVG, grouped by type."""
+        boundary = lines.line_types == LINE_TYPES.index(LineType.BOUNDARY)
+        horizontal = lines.line_types == LINE_TYPES.index(LineType.HORIZONTAL)
+        vertical = lines.line_types == LINE_TYPES.index(LineType.VERTICAL)
         
         # Add boundary lines (panel edges)
-        if grouped_lines["boundary"]:
+        if boundary.any():
             boundary_group = ET.SubElement(svg_root, "g")
             boundary_group.set("id", "panel-boundaries")
             boundary_group.set("class", "boundaries")
             
-            for line in grouped_lines["boundary"]:
-                self._add_line(boundary_group, line, self.config.boundary_style)
+            self._add_line_paths(boundary_group, lines, boundary, LineType.BOUNDARY,
+                                 self.config.boundary_style)
         
         # Add interior grid lines
         interior_group = ET.SubElement(svg_root, "g")
@@ -156,119 +189,100 @@ class SVGRenderer:
         interior_group.set("class", "grid")
         
         # Horizontal lines
-        if grouped_lines["horizontal"]:
+        if horizontal.any():
             h_group = ET.SubElement(interior_group, "g")
             h_group.set("class", "horizontal-lines")
             
-            for line in grouped_lines["horizontal"]:
-                self._add_line(h_group, line, self.config.grid_style)
+            self._add_line_paths(h_group, lines, horizontal, LineType.HORIZONTAL,
+                                 self.config.grid_style)
         
         # Vertical lines
-        if grouped_lines["vertical"]:
+        if vertical.any():
             v_group = ET.SubElement(interior_group, "g")
             v_group.set("class", "vertical-lines")
             
-            for line in grouped_lines["vertical"]:
-                self._add_line(v_group, line, self.config.grid_style)
+            self._add_line_paths(v_group, lines, vertical, LineType.VERTICAL,
+                                 self.config.grid_style)
     
-    def _add_line(self, parent: ET.Element, line: GridLine, style: SVGStyle):
-        """Add a single line element to the SVG."""
-        line_elem = ET.SubElement(parent, "line")
-        line_elem.set("x1", f"{line.start.x:.2f}")
-        line_elem.set("y1", f"{line.start.y:.2f}")
-        line_elem.set("x2", f"{line.end.x:.2f}")
-        line_elem.set("y2", f"{line.end.y:.2f}")
-        line_elem.set("stroke", style.stroke_color)
-        line_elem.set("stroke-width", str(style.stroke_width))
-        line_elem.set("stroke-opacity", str(style.stroke_opacity))
-        line_elem.set("fill", style.fill)
-        
-        # Add data attributes for panel identification
-        line_elem.set("data-panel", line.panel_label)
-        line_elem.set("data-type", line.line_type)
+    def _add_line_paths(self, parent: ET.Element, lines: '_RenderLines', rows: np.ndarray,
+                        line_type: LineType, style: SVGStyle):
+        """
+        Add lines of one type to the SVG as a single path per panel.
+        
+        Lines sharing a style and panel become one path of "M x1 y1 L x2 y2"
+        segments, so the style and data attributes are written once per
+        panel instead of once per line.
+        """
+        coords = lines.coords[rows]
+        label_ids = lines.label_ids[rows]
+        
+        for label_id in _in_order(label_ids):
+            path_elem = ET.SubElement(parent, "path")
+            path_elem.set("d", " ".join([
+                "M%.2f %.2f L%.2f %.2f" % segment
+                for segment in map(tuple, coords[label_ids == label_id].tolist())
+            ]))
+            path_elem.set("stroke", style.stroke_color)
+            path_elem.set("stroke-width", str(style.stroke_width))
+            path_elem.set("stroke-opacity", str(style.stroke_opacity))
+            path_elem.set("fill", style.fill)
+            
+            # Add data attributes for panel identification
+            path_elem.set("data-panel", lines.labels[label_id])
+            path_elem.set("data-type", line_type.value)
     
-    def _add_panel_labels(self, svg_root: ET.Element, grid_lines: List[GridLine]):
+    def _add_panel_labels(self, svg_root: ET.Element, lines: '_RenderLines'):
         """Add text labels for each panel."""
         labels_group = ET.SubElement(svg_root, "g")
         labels_group.set("id", "panel-labels")
         labels_group.set("class", "labels")
         
         # Find label positions for each panel
-        panel_positions = self._calculate_label_positions(grid_lines)
+        panel_positions = self._calculate_label_positions(lines)
         
         for panel_label, position in panel_positions.items():
-            if position:
-                text_elem = ET.SubElement(labels_group, "text")
-                text_elem.set("x", f"{position['x']:.2f}")
-                text_elem.set("y", f"{position['y']:.2f}")
-                text_elem.set("font-family", self.config.label_font_family)
-                text_elem.set("font-size", str(self.config.label_font_size))
-                text_elem.set("text-anchor", "middle")
-                text_elem.set("dominant-baseline", "central")
-                text_elem.set("fill", "#000000")
-                text_elem.set("stroke", "#ffffff")
-                text_elem.set("stroke-width", "2")
-                text_elem.set("paint-order", "stroke fill")
-                text_elem.text = panel_label
+            text_elem = ET.SubElement(labels_group, "text")
+            text_elem.set("x", f"{position['x']:.2f}")
+            text_elem.set("y", f"{position['y']:.2f}")
+            text_elem.set("font-family", self.config.label_font_family)
+            text_elem.set("font-size", str(self.config.label_font_size))
+            text_elem.set("text-anchor", "middle")
+            text_elem.set("dominant-baseline", "central")
+            text_elem.set("fill", "#000000")
+            text_elem.set("stroke", "#ffffff")
+            text_elem.set("stroke-width", "2")
+            text_elem.set("paint-order", "stroke fill")
+            text_elem.text = panel_label
     
-    def _calculate_label_positions(self, grid_lines: List[GridLine]) -> Dict[str, Optional[Dict[str, float]]]:
+    def _calculate_label_positions(self, lines: '_RenderLines') -> Dict[str, Dict[str, float]]:
         """Calculate optimal positions for panel labels."""
-        panel_bounds = {}
+        view_width, view_height = self._get_view_size()
+        label_positions = {}
         
-        # Calculate bounds for each panel
-        for line in grid_lines:
-            panel_label = line.panel_label
+        for label_id in _in_order(lines.label_ids):
+            # Bounds of all line endpoints of the panel
+            points = lines.coords[lines.label_ids == label_id].reshape(-1, 2)
+            (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
             
-            if panel_label not in panel_bounds:
-                panel_bounds[panel_label] = {
-                    "min_x": float("inf"), "max_x": float("-inf"),
-                    "min_y": float("inf"), "max_y": float("-inf")
-                }
+            center_x = (float(min_x) + float(max_x)) / 2
+            center_y = (float(min_y) + float(max_y)) / 2
             
-            bounds = panel_bounds[panel_label]
+            # Ensure labels are within canvas bounds
+            center_x = max(20, min(center_x, view_width - 20))
+            center_y = max(20, min(center_y, view_height - 20))
             
-            # Update bounds with line endpoints
-            for point in [line.start, line.end]:
-                bounds["min_x"] = min(bounds["min_x"], point.x)
-                bounds["max_x"] = max(bounds["max_x"], point.x)
-                bounds["min_y"] = min(bounds["min_y"], point.y)
-                bounds["max_y"] = max(bounds["max_y"], point.y)
-        
-        # Calculate center positions
-        label_positions = {}
-        for panel_label, bounds in panel_bounds.items():
-            if (bounds["min_x"] != float("inf") and 
-                bounds["max_x"] != float("-inf")):
-                
-                center_x = (bounds["min_x"] + bounds["max_x"]) / 2
-                center_y = (bounds["min_y"] + bounds["max_y"]) / 2
-                
-                # Ensure labels are within canvas bounds
-                center_x = max(20, min(center_x, self.config.width - 20))
-                center_y = max(20, min(center_y, self.config.height - 20))
-                
-                label_positions[panel_label] = {"x": center_x, "y": center_y}
-            else:
-                label_positions[panel_label] = None
+            label_positions[lines.labels[label_id]] = {"x": center_x, "y": center_y}
         
         return label_positions
     
-    def _write_svg_file(self, svg_root: ET.Element, output_path: str):
-        """Write SVG tree to file with proper formatting."""
+    def _write_svg_file(self, document: bytes, output_path: str):
+        """Write an encoded SVG document to file."""
         # Create output directory if it doesn't exist
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Create tree and write with declaration
-        tree = ET.ElementTree(svg_root)
-        
-        # Format the XML nicely
-        self._indent_xml(svg_root)
-        
-        # Write to file
-        with open(output_path, 'wb') as f:
-            f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
-            tree.write(f, encoding='utf-8')
+        # Write the whole document in one call
+        output_path.write_bytes(document)
     
     def _indent_xml(self, elem: ET.Element, level: int = 0):
         """Add indentation to XML for better readability."""
@@ -286,12 +300,12 @@ class SVGRenderer:
             if level and (not elem.tail or not elem.tail.strip()):
                 elem.tail = indent
     
-    def get_file_size_estimate(self, grid_lines: List[GridLine]) -> int:
+    def get_file_size_estimate(self, grid_lines: Union[List[GridLine], GridLineBatch]) -> int:
         """
         Estimate the file size of the SVG output.
         
         Args:
-            grid_lines: List of grid lines to estimate for
+            grid_lines: Grid lines to estimate for, as a list or a GridLineBatch
             
         Returns:
             Estimated file size in bytes
@@ -299,22 +313,64 @@ class SVGRenderer:
         # Base SVG overhead
         base_size = 1000  # XML declaration, SVG element, etc.
         
-        # Estimate bytes per line (including attributes)
-        bytes_per_line = 120
+        # Estimate bytes per line segment within a path
+        bytes_per_line = 34
+        
+        # Estimate bytes per path element (attributes), one per panel and line type
+        bytes_per_path = 140
         
         # Estimate bytes per label
         bytes_per_label = 150
         
-        total_size = base_size + (len(grid_lines) * bytes_per_line)
+        lines = _RenderLines.from_grid_lines(grid_lines)
+        
+        # One path per distinct (panel, line type) pair
+        path_count = len(np.unique(lines.label_ids * len(LINE_TYPES) + lines.line_types))
+        total_size = base_size + (len(lines.line_types) * bytes_per_line) + (path_count * bytes_per_path)
         
         if self.config.show_labels:
             # Count unique panels
-            unique_panels = len(set(line.panel_label for line in grid_lines))
+            unique_panels = len(np.unique(lines.label_ids))
             total_size += unique_panels * bytes_per_label
         
         return total_size
 
 
+class _RenderLines(NamedTuple):
+    """Grid lines as parallel arrays, with panels merged by label."""
+    coords: np.ndarray      # (N, 4) rows of x1, y1, x2, y2
+    label_ids: np.ndarray   # (N,) index into labels
+    line_types: np.ndarray  # (N,) uint8 index into LINE_TYPES
+    labels: List[str]
+    
+    @classmethod
+    def from_grid_lines(cls, grid_lines: Union[List[GridLine], GridLineBatch]) -> '_RenderLines':
+        """Convert a GridLine list or GridLineBatch for rendering."""
+        if isinstance(grid_lines, GridLineBatch):
+            batch = grid_lines
+        else:
+            # Lines of an unknown type have no group to render into; skip them
+            batch = GridLineBatch.from_lines([line for line in grid_lines if line.line_type in LINE_TYPES])
+        
+        # Distinct panels may share a label; they render as one panel
+        labels = list(dict.fromkeys(batch.panel_labels))
+        label_index = {label: index for index, label in enumerate(labels)}
+        panel_label_ids = np.array([label_index[label] for label in batch.panel_labels], dtype=np.intp)
+        
+        return cls(
+            coords=np.hstack([batch.starts, batch.ends]),
+            label_ids=panel_label_ids[batch.panel_ids],
+            line_types=batch.line_types,
+            labels=labels
+        )
+
+
+def _in_order(values: np.ndarray) -> np.ndarray:
+    """Get the distinct values of an array in order of first appearance."""
+    _, first_index = np.unique(values, return_index=True)
+    return values[np.sort(first_index)]
+
+
 def create_standard_svg_config(width: int = 1920, height: int = 1080) -> SVGConfig:
     """
     Create a standard SVG configuration.
@@ -4,6 +4,10 @@ import tempfile
 import os
 from pathlib import Path
 
+from perspective.camera import CameraConfig
+from perspective.transforms import Point3D
+from layouts.three_panel import ThreePanelLayout, create_standard_3panel_config
+
 
 @pytest.fixture
 def temp_dir():
@@ -12,6 +16,32 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def camera_config():
+    """
+    Provide the standard test camera configuration.
+    
+    Function-scoped on purpose: a Camera shares and updates its config, so
+    each test needs its own instance.
+    """
+    return CameraConfig(
+        position=Point3D(0.0, 0.0, 5.0),
+        target=Point3D(0.0, 0.0, 0.0),
+        fov_degrees=50.0
+    )
+
+
+@pytest.fixture(scope="module")
+def panels():
+    """
+    Provide the panels of the standard 3-panel layout.
+    
+    Module-scoped: grid generation only reads panels, so tests in a module
+    can share one layout build.
+    """
+    return ThreePanelLayout(create_standard_3panel_config()).get_panels()
+
+
 @pytest.fixture
 def sample_config():
     """Provide a sample configuration for testing."""
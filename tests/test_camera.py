@@ -1,5 +1,6 @@
 """Tests for camera module."""
 
+import dataclasses
 import pytest
 import numpy as np
 import sys
@@ -9,7 +10,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from perspective.camera import Camera, CameraConfig, create_standard_camera, create_orthographic_camera
-from perspective.transforms import Point3D, Vector3D
+from perspective.transforms import Point3D, Vector3D, project_to_screen
 
 
 class TestCameraConfig:
@@ -42,32 +43,52 @@ class TestCameraConfig:
         
         assert config.up_vector.x == 1.0
         assert config.up_vector.y == 0.0
-
-
-class TestCamera:
-    """Test Camera class."""
     
-    def test_creation(self):
-        """Test Camera creation."""
+    def test_slots(self):
+        """Test that CameraConfig uses slots instead of a per-instance dict."""
         config = CameraConfig(
             position=Point3D(0.0, 0.0, 5.0),
             target=Point3D(0.0, 0.0, 0.0),
             fov_degrees=50.0
         )
-        camera = Camera(config)
-        
-        assert camera.position.z == 5.0
-        assert camera.target.x == 0.0
-        assert camera.fov_degrees == 50.0
+        assert not hasattr(config, "__dict__")
     
-    def test_property_setters(self):
-        """Test camera property setters."""
+    def test_equality_and_replace(self):
+        """Test that configs compare by value and support dataclasses.replace."""
         config = CameraConfig(
             position=Point3D(0.0, 0.0, 5.0),
             target=Point3D(0.0, 0.0, 0.0),
             fov_degrees=50.0
         )
-        camera = Camera(config)
+        same = CameraConfig(Point3D(0.0, 0.0, 5.0), Point3D(0.0, 0.0, 0.0), 50.0)
+        assert config == same
+        
+        wider = dataclasses.replace(config, fov_degrees=60.0)
+        assert wider.fov_degrees == 60.0
+        assert wider.position == config.position
+        assert wider.points is not config.points
+        assert wider != config
+        
+        moved = dataclasses.replace(config, position=Point3D(1.0, 2.0, 3.0))
+        assert moved.position == Point3D(1.0, 2.0, 3.0)
+        assert moved.target == config.target
+        assert config.position.z == 5.0
+
+
+class TestCamera:
+    """Test Camera class."""
+    
+    def test_creation(self, camera_config):
+        """Test Camera creation."""
+        camera = Camera(camera_config)
+        
+        assert camera.position.z == 5.0
+        assert camera.target.x == 0.0
+        assert camera.fov_degrees == 50.0
+    
+    def test_property_setters(self, camera_config):
+        """Test camera property setters."""
+        camera = Camera(camera_config)
         
         # Test position setter
         new_position = Point3D(1.0, 2.0, 3.0)
@@ -87,14 +108,9 @@ class TestCamera:
         camera.fov_degrees = 60.0
         assert camera.fov_degrees == 60.0
     
-    def test_fov_validation(self):
+    def test_fov_validation(self, camera_config):
         """Test FOV validation."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         # Valid FOV
         camera.fov_degrees = 45.0
@@ -108,14 +124,9 @@ class TestCamera:
         with pytest.raises(ValueError):
             camera.fov_degrees = 180.0
     
-    def test_view_matrix_generation(self):
+    def test_view_matrix_generation(self, camera_config):
         """Test view matrix generation."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         view_matrix = camera.get_view_matrix()
         
@@ -126,14 +137,9 @@ class TestCamera:
         transformed_target = view_matrix.transform_point(camera.target)
         assert transformed_target.z < 0  # Negative Z in view space means in front
     
-    def test_projection_matrix_generation(self):
+    def test_projection_matrix_generation(self, camera_config):
         """Test projection matrix generation."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         aspect_ratio = 16.0 / 9.0
         projection_matrix = camera.get_projection_matrix(aspect_ratio)
@@ -142,26 +148,17 @@ class TestCamera:
         assert projection_matrix.matrix.shape == (4, 4)
         assert projection_matrix.matrix[3, 2] == -1.0  # Perspective division
     
-    def test_distance_calculation(self):
+    def test_distance_calculation(self, camera_config):
         """Test distance to target calculation."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         distance = camera.get_distance_to_target()
         assert abs(distance - 5.0) < 1e-10
+        assert type(distance) is float
     
-    def test_set_distance_to_target(self):
+    def test_set_distance_to_target(self, camera_config):
         """Test setting distance to target."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         # Set new distance
         camera.set_distance_to_target(10.0)
@@ -175,14 +172,9 @@ class TestCamera:
         assert abs(camera.position.y) < 1e-10
         assert camera.position.z == 10.0
     
-    def test_set_distance_validation(self):
+    def test_set_distance_validation(self, camera_config):
         """Test distance setting validation."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         # Invalid distance
         with pytest.raises(ValueError):
@@ -191,14 +183,9 @@ class TestCamera:
         with pytest.raises(ValueError):
             camera.set_distance_to_target(0.0)
     
-    def test_orbit_around_target(self):
+    def test_orbit_around_target(self, camera_config):
         """Test orbital positioning around target."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         # Orbit to 90 degrees azimuth (should be on X axis)
         camera.orbit_around_target(90.0, 0.0, 5.0)
@@ -211,14 +198,9 @@ class TestCamera:
         distance = camera.get_distance_to_target()
         assert abs(distance - 5.0) < 1e-10
     
-    def test_orbit_validation(self):
+    def test_orbit_validation(self, camera_config):
         """Test orbit parameter validation."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         # Invalid distance
         with pytest.raises(ValueError):
@@ -252,14 +234,9 @@ class TestCameraFactories:
 class TestCameraMatrixUpdates:
     """Test camera matrix update behavior."""
     
-    def test_matrix_caching(self):
+    def test_matrix_caching(self, camera_config):
         """Test that matrices are cached until camera changes."""
-        config = CameraConfig(
-            position=Point3D(0.0, 0.0, 5.0),
-            target=Point3D(0.0, 0.0, 0.0),
-            fov_degrees=50.0
-        )
-        camera = Camera(config)
+        camera = Camera(camera_config)
         
         # Get matrices twice - should be the same object (cached)
         view1 = camera.get_view_matrix()
@@ -274,6 +251,100 @@ class TestCameraMatrixUpdates:
         
         # Should be a new matrix
         assert view1 is not view3
+    
+    def test_points_array(self):
+        """Test that position and target are backed by one (2, 3) array."""
+        config = CameraConfig(
+            position=Point3D(1.0, 2.0, 3.0),
+            target=Point3D(4.0, 5.0, 6.0),
+            fov_degrees=50.0
+        )
+        np.testing.assert_array_equal(config.points, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        
+        config.target = Point3D(0.0, 0.0, 0.0)
+        np.testing.assert_array_equal(config.points[1], [0.0, 0.0, 0.0])
+        assert config.target == Point3D(0.0, 0.0, 0.0)
+    
+    def test_redundant_setters_keep_cache(self, camera_config):
+        """Test that setting an unchanged pose does not rebuild the view."""
+        camera = Camera(camera_config)
+        view1 = camera.get_view_matrix()
+        
+        camera.position = Point3D(0.0, 0.0, 5.0)
+        camera.target = Point3D(0.0, 0.0, 0.0)
+        camera.set_distance_to_target(5.0)
+        assert camera.get_view_matrix() is view1
+        
+        # Writing back a modified copy of the position is detected
+        position = camera.position
+        position.x = 2.0
+        camera.position = position
+        assert camera.get_view_matrix() is not view1
+    
+    def test_view_projection_matrix(self):
+        """Test the cached combined view-projection matrix."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        
+        combined = camera.get_view_projection_matrix(4.0 / 3.0)
+        expected = camera.get_projection_matrix(4.0 / 3.0).matrix @ camera.get_view_matrix().matrix
+        np.testing.assert_allclose(combined.matrix, expected)
+        assert camera.get_view_projection_matrix(4.0 / 3.0) is combined
+        
+        camera.position = Point3D(1.0, 4.0, 10.0)
+        assert camera.get_view_projection_matrix(4.0 / 3.0) is not combined
+        assert camera.get_view_projection_matrix(16.0 / 9.0) is not combined
+    
+    def test_project_points(self):
+        """Test batched projection through the camera."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        points = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, -1.0]])
+        
+        screen = camera.project_points(points, 800, 600)
+        
+        assert screen.shape == (2, 2)
+        for point, (x, y) in zip(points, screen):
+            expected = project_to_screen(
+                Point3D(*point), camera.get_view_matrix(),
+                camera.get_projection_matrix(800 / 600), 800, 600
+            )
+            assert abs(x - expected.x) < 1e-9
+            assert abs(y - expected.y) < 1e-9
+    
+    def test_projection_cached_per_aspect_ratio(self, camera_config):
+        """Test that the projection is cached but follows the aspect ratio."""
+        camera = Camera(camera_config)
+        
+        # Building the view matrix must not pin the projection's aspect ratio
+        camera.get_view_matrix()
+        wide = camera.get_projection_matrix(16.0 / 9.0)
+        assert camera.get_projection_matrix(16.0 / 9.0) is wide
+        
+        square = camera.get_projection_matrix(1.0)
+        assert square is not wide
+        assert abs(wide.matrix[0, 0] * 16.0 / 9.0 - square.matrix[0, 0]) < 1e-12
+        
+        # Moving the camera leaves the projection untouched
+        camera.position = Point3D(1.0, 0.0, 5.0)
+        assert camera.get_projection_matrix(1.0) is square
+        
+        # Changing the FOV rebuilds it
+        camera.fov_degrees = 60.0
+        assert camera.get_projection_matrix(1.0) is not square
+    
+    def test_projection_cache_holds_several_viewports(self):
+        """Test that alternating aspect ratios reuse their projections."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        
+        preview = camera.get_projection_matrix(4.0 / 3.0)
+        export = camera.get_projection_matrix(16.0 / 9.0)
+        assert camera.get_projection_matrix(4.0 / 3.0) is preview
+        assert camera.get_projection_matrix(16.0 / 9.0) is export
+        
+        # Older entries are evicted once the cache is full
+        for aspect in (1.0, 1.5, 2.0, 2.5):
+            camera.get_projection_matrix(aspect)
+        assert len(camera._projection_cache) == Camera.PROJECTION_CACHE_SIZE
+        assert camera.get_projection_matrix(4.0 / 3.0) is not preview
 
 
 if __name__ == "__main__":
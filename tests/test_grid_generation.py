@@ -4,15 +4,21 @@ import pytest
 import sys
 import os
 import tempfile
+import numpy as np
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from perspective.grid_generator import GridGenerator, GridConfig, GridLine
+from perspective.grid_generator import (
+    GridGenerator, GridConfig, GridLine, GridLineBatch, LineType, LINE_TYPES,
+    liang_barsky_batch, outcodes,
+    _clip_bounds, _panel_in_view
+)
 from perspective.camera import create_standard_camera
-from perspective.transforms import Point2D
-from layouts.three_panel import ThreePanelLayout, create_standard_3panel_config
+from perspective.kernels import project_clip_lines
+from perspective.transforms import Point2D, Point3D, project_points_to_screen
+from layouts.base_layout import Panel
 from rendering.svg_renderer import SVGRenderer, SVGConfig, create_standard_svg_config
 
 
@@ -35,13 +41,8 @@ class TestGridGenerator:
         assert generator.config.density == 0.5
         assert generator.config.min_line_length == 5.0
     
-    def test_grid_generation(self):
+    def test_grid_generation(self, panels):
         """Test basic grid generation."""
-        # Create test layout and camera
-        layout_config = create_standard_3panel_config()
-        layout = ThreePanelLayout(layout_config)
-        panels = layout.get_panels()
-        
         camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
         
         # Generate grid
@@ -59,12 +60,8 @@ class TestGridGenerator:
         expected_labels = {"Floor", "Left Wall", "Right Wall"}
         assert expected_labels.issubset(panel_labels)
     
-    def test_grid_line_types(self):
+    def test_grid_line_types(self, panels):
         """Test that different line types are generated."""
-        layout_config = create_standard_3panel_config()
-        layout = ThreePanelLayout(layout_config)
-        panels = layout.get_panels()
-        
         camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
         
         generator = GridGenerator()
@@ -78,12 +75,8 @@ class TestGridGenerator:
         interior_lines = [line for line in grid_lines if line.line_type in ["horizontal", "vertical"]]
         assert len(interior_lines) > 0
     
-    def test_density_affects_grid(self):
+    def test_density_affects_grid(self, panels):
         """Test that density setting affects number of lines."""
-        layout_config = create_standard_3panel_config()
-        layout = ThreePanelLayout(layout_config)
-        panels = layout.get_panels()
-        
         camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
         
         # Generate with fine density
@@ -97,12 +90,8 @@ class TestGridGenerator:
         # Fine density should generate more lines
         assert len(fine_lines) > len(coarse_lines)
     
-    def test_line_length_filtering(self):
+    def test_line_length_filtering(self, panels):
         """Test that very short lines are filtered out."""
-        layout_config = create_standard_3panel_config()
-        layout = ThreePanelLayout(layout_config)
-        panels = layout.get_panels()
-        
         camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
         
         # Use a high minimum line length
@@ -111,18 +100,144 @@ class TestGridGenerator:
         grid_lines = generator.generate_grid(panels, camera, 800, 600)
         
         # All lines should meet minimum length requirement
-        for line in grid_lines:
-            dx = line.end.x - line.start.x
-            dy = line.end.y - line.start.y
-            length = (dx*dx + dy*dy)**0.5
-            assert length >= config.min_line_length
+        batch = GridLineBatch.from_lines(grid_lines)
+        lengths = np.hypot(*(batch.ends - batch.starts).T)
+        short = np.flatnonzero(lengths < config.min_line_length)
+        assert short.size == 0, f"lines shorter than minimum: {short.tolist()}"
     
-    def test_grid_stats(self):
-        """Test grid statistics generation."""
-        layout_config = create_standard_3panel_config()
-        layout = ThreePanelLayout(layout_config)
-        panels = layout.get_panels()
+    def test_grid_batch(self, panels):
+        """Test that the array batch converts to the same lines as generate_grid."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        
+        generator = GridGenerator(GridConfig(min_line_length=50.0))
+        batch = generator.generate_grid_batch(panels, camera, 800, 600)
         
+        assert isinstance(batch, GridLineBatch)
+        assert batch.starts.shape == (len(batch), 2)
+        assert batch.starts.dtype == np.float32
+        assert batch.ends.shape == (len(batch), 2)
+        assert batch.panel_labels == ("Floor", "Left Wall", "Right Wall")
+        assert set(batch.line_types.tolist()) <= set(range(len(LINE_TYPES)))
+        assert np.all(np.hypot(*(batch.ends - batch.starts).T) >= 50.0)
+        
+        lines = batch.to_lines()
+        assert lines == generator.generate_grid(panels, camera, 800, 600)
+    
+    def test_grid_memoization(self, panels):
+        """Test that unchanged inputs reuse the previous grid."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        generator = GridGenerator()
+        
+        batch = generator.generate_grid_batch(panels, camera, 800, 600)
+        assert generator.generate_grid_batch(panels, camera, 800, 600) is batch
+        
+        # Returned lines are independent even when the grid is reused
+        lines = generator.generate_grid(panels, camera, 800, 600)
+        expected = generator.generate_grid(panels, camera, 800, 600)
+        lines[0].start.x = -99999.0
+        lines.clear()
+        assert generator.generate_grid(panels, camera, 800, 600) == expected
+        
+        # The shared batch cannot be modified in place
+        for array in (batch.starts, batch.ends, batch.panel_ids, batch.line_types):
+            with pytest.raises(ValueError):
+                array[0] = 0
+        with pytest.raises(TypeError):
+            batch.panel_labels[0] = "Changed"
+        
+        # Fields that do not affect the lines keep the cached grid
+        generator.config.max_lines_per_panel = 5
+        assert generator.generate_grid_batch(panels, camera, 800, 600) is batch
+        
+        # Any input change produces a fresh grid
+        assert generator.generate_grid_batch(panels, camera, 1024, 600) is not batch
+        camera.orbit_around_target(30.0, 20.0, 12.0)
+        assert generator.generate_grid_batch(panels, camera, 800, 600) is not batch
+        generator.config.density = 1.0
+        assert generator.generate_grid_batch(panels, camera, 800, 600) is not batch
+        
+        # The cache stays bounded
+        for width in range(700, 720):
+            generator.generate_grid_batch(panels, camera, width, 600)
+        assert len(generator._cache) == GridGenerator.CACHE_SIZE
+    
+    def test_line_geometry_reused(self, panels):
+        """Test that camera and viewport changes reuse the 3D grid lines."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        generator = GridGenerator()
+        
+        generator.generate_grid_batch(panels, camera, 800, 600)
+        geometry = generator._geometry
+        generator.generate_grid_batch(panels, camera, 1920, 1080)
+        camera.orbit_around_target(30.0, 20.0, 12.0)
+        generator.generate_grid_batch(panels, camera, 800, 600)
+        assert generator._geometry is geometry
+        
+        # Density changes the 3D lines themselves
+        generator.config.density = 1.0
+        generator.generate_grid_batch(panels, camera, 800, 600)
+        assert generator._geometry is not geometry
+    
+    def test_reversed_corners_stay_inside_panel(self):
+        """Test that a panel with corners in reverse order keeps its lines inside it."""
+        floor = Panel(
+            label="Floor",
+            corners=np.array([[144.0, 0.0, 0.0], [0.0, 0.0, 0.0],
+                              [0.0, 0.0, 144.0], [144.0, 0.0, 144.0]]),
+            normal=Point3D(0.0, 1.0, 0.0),
+            panel_type="floor"
+        )
+        forward = Panel(
+            label="Floor",
+            corners=np.array([[0.0, 0.0, 0.0], [144.0, 0.0, 0.0],
+                              [144.0, 0.0, 144.0], [0.0, 0.0, 144.0]]),
+            normal=Point3D(0.0, 1.0, 0.0),
+            panel_type="floor"
+        )
+        generator = GridGenerator()
+        geometry = generator._build_line_geometry([floor])
+        
+        interior = geometry.line_types != LINE_TYPES.index(LineType.BOUNDARY)
+        points = np.concatenate([geometry.starts[interior], geometry.ends[interior]])
+        assert interior.any()
+        assert points.min() >= 0.0
+        assert points.max() <= 144.0
+        
+        # Same grid as the forward-ordered panel, just walked the other way
+        expected = generator._build_line_geometry([forward])
+        assert np.count_nonzero(interior) == np.count_nonzero(
+            expected.line_types != LINE_TYPES.index(LineType.BOUNDARY))
+    
+    def test_offscreen_panel_culled(self, panels):
+        """Test that a panel projecting entirely off screen generates no lines."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        
+        # Wall in front of the camera but far off to the side of the view
+        offscreen = Panel(
+            label="Offscreen Wall",
+            corners=np.array([[5000.0, 0.0, -10.0], [5000.0, 0.0, -100.0],
+                              [5000.0, 100.0, -100.0], [5000.0, 100.0, -10.0]]),
+            normal=Point3D(1.0, 0.0, 0.0),
+            panel_type="wall"
+        )
+        mvp = camera.get_view_projection_matrix(800 / 600).matrix
+        assert not _panel_in_view(offscreen.corners_array, mvp, 800, 600, _clip_bounds(800, 600))
+        
+        generator = GridGenerator()
+        batch = generator.generate_grid_batch(panels + [offscreen], camera, 800, 600)
+        assert 3 not in batch.panel_ids.tolist()
+        assert len(batch) == len(generator.generate_grid_batch(panels, camera, 800, 600))
+    
+    def test_no_panels(self):
+        """Test grid generation with an empty panel list."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        generator = GridGenerator()
+        
+        assert generator.generate_grid([], camera, 800, 600) == []
+        assert len(generator.generate_grid_batch([], camera, 800, 600)) == 0
+    
+    def test_grid_stats(self, panels):
+        """Test grid statistics generation."""
         camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
         
         generator = GridGenerator()
@@ -139,6 +254,139 @@ class TestGridGenerator:
         assert stats["line_types"]["boundary"] >= 0
         assert stats["line_types"]["horizontal"] >= 0
         assert stats["line_types"]["vertical"] >= 0
+    
+    def test_batch_stats_match_list_stats(self, panels):
+        """Test that stats from a batch match stats from its GridLines."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        
+        generator = GridGenerator()
+        batch = generator.generate_grid_batch(panels, camera, 800, 600)
+        
+        batch_stats = generator.get_grid_stats(batch)
+        list_stats = generator.get_grid_stats(batch.to_lines())
+        
+        assert batch_stats == list_stats
+        assert list(batch_stats["panels"]) == ["Floor", "Left Wall", "Right Wall"]
+        assert sum(batch_stats["panels"].values()) == len(batch)
+    
+    def test_line_type_enum(self, panels):
+        """Test that line types are enum members that still compare as strings."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        
+        generator = GridGenerator()
+        batch = generator.generate_grid_batch(panels, camera, 800, 600)
+        lines = batch.to_lines()
+        
+        assert batch.line_types.dtype == np.uint8
+        assert all(isinstance(line.line_type, LineType) for line in lines)
+        assert LineType.BOUNDARY == "boundary"
+        assert str(LineType.BOUNDARY) == f"{LineType.BOUNDARY}" == "boundary"
+        
+        # Stats accept both enum members and plain strings
+        lines.append(GridLine(Point2D(0, 0), Point2D(100, 0), "Floor", "boundary"))
+        stats = generator.get_grid_stats(lines)
+        expected = np.bincount(batch.line_types, minlength=len(LINE_TYPES)).tolist()
+        expected[LINE_TYPES.index(LineType.BOUNDARY)] += 1
+        assert list(stats["line_types"].values()) == expected
+
+
+class TestLineClipping:
+    """Test batched Liang-Barsky line clipping."""
+    
+    def test_clipping_cases(self):
+        """Test inside, crossing, outside and parallel lines."""
+        starts = np.array([
+            [10.0, 10.0],    # Fully inside
+            [-50.0, 50.0],   # Crosses the left edge
+            [-50.0, -50.0],  # Fully outside, above-left
+            [50.0, 150.0],   # Parallel to X, below the rectangle
+            [-50.0, 50.0],   # Crosses both side edges
+        ])
+        ends = np.array([
+            [90.0, 90.0],
+            [50.0, 50.0],
+            [-10.0, -10.0],
+            [80.0, 150.0],
+            [150.0, 50.0],
+        ])
+        
+        clipped_starts, clipped_ends, visible = liang_barsky_batch(
+            starts, ends, 0.0, 0.0, 100.0, 100.0
+        )
+        
+        assert visible.tolist() == [True, True, False, False, True]
+        np.testing.assert_array_equal(clipped_starts[0], [10.0, 10.0])
+        np.testing.assert_array_equal(clipped_ends[0], [90.0, 90.0])
+        np.testing.assert_allclose(clipped_starts[1], [0.0, 50.0])
+        np.testing.assert_allclose(clipped_ends[1], [50.0, 50.0])
+        np.testing.assert_allclose(clipped_starts[4], [0.0, 50.0])
+        np.testing.assert_allclose(clipped_ends[4], [100.0, 50.0])
+    
+    def test_inside_lines_untouched(self):
+        """Test that fully inside lines skip clipping and keep exact endpoints."""
+        starts = np.array([[0.1, 0.2], [100.0, 100.0], [0.0, 0.0]], dtype=np.float32)
+        ends = np.array([[99.9, 99.8], [0.0, 0.0], [0.0, 0.0]], dtype=np.float32)
+        
+        clipped_starts, clipped_ends, visible = liang_barsky_batch(
+            starts, ends, 0.0, 0.0, 100.0, 100.0
+        )
+        
+        assert visible.all()
+        assert clipped_starts.dtype == np.float32
+        np.testing.assert_array_equal(clipped_starts, starts)
+        np.testing.assert_array_equal(clipped_ends, ends)
+    
+    def test_outcodes(self):
+        """Test region code bit packing."""
+        points = np.array([
+            [50.0, 50.0],    # Inside
+            [-1.0, 50.0],    # Left
+            [101.0, 50.0],   # Right
+            [50.0, -1.0],    # Top
+            [50.0, 101.0],   # Bottom
+            [-1.0, 101.0],   # Left and bottom
+        ])
+        
+        codes = outcodes(points, 0.0, 0.0, 100.0, 100.0)
+        
+        assert codes.dtype == np.uint8
+        assert codes.tolist() == [0, 1, 2, 4, 8, 9]
+    
+    def test_empty_batch(self):
+        """Test clipping an empty batch."""
+        empty = np.empty((0, 2))
+        clipped_starts, clipped_ends, visible = liang_barsky_batch(
+            empty, empty, 0.0, 0.0, 100.0, 100.0
+        )
+        
+        assert len(visible) == 0
+        assert clipped_starts.shape == (0, 2)
+
+
+class TestProjectClipKernel:
+    """Test the fused projection and clipping kernel."""
+    
+    def test_matches_numpy_path(self):
+        """Test that the kernel agrees with batched projection plus Liang-Barsky."""
+        rng = np.random.default_rng(0)
+        starts_3d = rng.uniform(-50.0, 50.0, size=(200, 3))
+        ends_3d = rng.uniform(-50.0, 50.0, size=(200, 3))
+        
+        camera = create_standard_camera(distance=60.0, fov_degrees=50.0)
+        mvp = camera.get_view_projection_matrix(800 / 600).matrix
+        bounds = (-400.0, -400.0, 1200.0, 1000.0)
+        
+        starts, ends, visible = project_clip_lines(starts_3d, ends_3d, mvp, 800, 600, *bounds)
+        
+        screen = project_points_to_screen(np.concatenate([starts_3d, ends_3d]), mvp, 800, 600)
+        expected_starts, expected_ends, expected_visible = liang_barsky_batch(
+            screen[:200], screen[200:], *bounds
+        )
+        
+        np.testing.assert_array_equal(visible, expected_visible)
+        # Kernel output is float32, so compare at float32 precision
+        np.testing.assert_allclose(starts[visible], expected_starts[visible], rtol=1e-5, atol=1e-3)
+        np.testing.assert_allclose(ends[visible], expected_ends[visible], rtol=1e-5, atol=1e-3)
 
 
 class TestSVGRenderer:
@@ -160,13 +408,9 @@ class TestSVGRenderer:
         assert renderer.config.height == 1080
         assert renderer.config.show_labels == True
     
-    def test_svg_rendering(self):
+    def test_svg_rendering(self, panels):
         """Test basic SVG file generation."""
         # Generate some test grid lines
-        layout_config = create_standard_3panel_config()
-        layout = ThreePanelLayout(layout_config)
-        panels = layout.get_panels()
-        
         camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
         
         generator = GridGenerator()
@@ -187,7 +431,10 @@ class TestSVGRenderer:
             assert '<?xml version="1.0" encoding="UTF-8"?>' in svg_content
             assert '<svg xmlns="http://www.w3.org/2000/svg"' in svg_content
             assert '<title>Test Grid</title>' in svg_content
-            assert '<line' in svg_content  # Should have line elements
+            assert '<path' in svg_content  # Lines are written as path elements
+            
+            # The file holds exactly the in-memory document
+            assert svg_content == renderer.render_to_string(grid_lines, "Test Grid")
     
     def test_svg_structure(self):
         """Test SVG file structure and organization."""
@@ -199,21 +446,56 @@ class TestSVGRenderer:
             GridLine(Point2D(0, 50), Point2D(100, 50), "Floor", "horizontal")
         ]
         
+        renderer = SVGRenderer()
+        svg_content = renderer.render_to_string(test_lines, "Structure Test")
+        
+        # Should have organized groups
+        assert 'id="panel-boundaries"' in svg_content
+        assert 'id="grid-lines"' in svg_content
+        assert 'class="horizontal-lines"' in svg_content
+        assert 'class="vertical-lines"' in svg_content
+        
+        # One path per panel and line type, holding one segment per line
+        assert svg_content.count('<path') == 3
+        assert 'd="M0.00 0.00 L100.00 0.00 M0.00 0.00 L0.00 100.00"' in svg_content
+    
+    def test_render_batch(self, panels):
+        """Test that rendering a GridLineBatch matches rendering its lines."""
+        camera = create_standard_camera(distance=10.0, fov_degrees=50.0)
+        batch = GridGenerator().generate_grid_batch(panels, camera, 800, 600)
+        
+        renderer = SVGRenderer()
+        assert renderer.render_to_string(batch, "Grid") == renderer.render_to_string(batch.to_lines(), "Grid")
+        assert renderer.get_file_size_estimate(batch) == renderer.get_file_size_estimate(batch.to_lines())
+    
+    def test_view_box(self):
+        """Test rendering a grid at a different output size than it was generated for."""
+        test_lines = [
+            GridLine(Point2D(0, 0), Point2D(1920, 1080), "Floor", "boundary")
+        ]
+        
+        config = SVGConfig(width=3840, height=2160, view_box=(1920, 1080))
+        renderer = SVGRenderer(config)
+        svg_content = renderer.render_to_string(test_lines, "View Box Test")
+        
+        assert 'width="3840" height="2160" viewBox="0 0 1920 1080"' in svg_content
+        assert '<rect x="0" y="0" width="1920" height="1080"' in svg_content
+    
+    def test_unknown_line_type_skipped(self):
+        """Test that lines of an unknown type are left out instead of failing the render."""
+        test_lines = [
+            GridLine(Point2D(0, 0), Point2D(100, 0), "Floor", "boundary"),
+            GridLine(Point2D(0, 50), Point2D(100, 50), "Floor", "diagonal"),
+        ]
+        
+        renderer = SVGRenderer()
+        svg_content = renderer.render_to_string(test_lines, "Unknown Type Test")
+        
+        assert svg_content == renderer.render_to_string(test_lines[:1], "Unknown Type Test")
+        assert renderer.get_file_size_estimate(test_lines) == renderer.get_file_size_estimate(test_lines[:1])
+        
         with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "structure_test.svg"
-            
-            renderer = SVGRenderer()
-            success = renderer.render(test_lines, str(output_path), "Structure Test")
-            
-            assert success == True
-            
-            svg_content = output_path.read_text()
-            
-            # Should have organized groups
-            assert 'id="panel-boundaries"' in svg_content
-            assert 'id="grid-lines"' in svg_content
-            assert 'class="horizontal-lines"' in svg_content
-            assert 'class="vertical-lines"' in svg_content
+            assert renderer.render(test_lines, str(Path(temp_dir) / "unknown.svg"), "Unknown Type Test")
     
     def test_label_generation(self):
         """Test panel label generation."""
@@ -222,21 +504,14 @@ class TestSVGRenderer:
             GridLine(Point2D(100, 0), Point2D(100, 100), "Test Panel", "boundary"),
         ]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "labels_test.svg"
-            
-            config = SVGConfig(show_labels=True)
-            renderer = SVGRenderer(config)
-            success = renderer.render(test_lines, str(output_path), "Labels Test")
-            
-            assert success == True
-            
-            svg_content = output_path.read_text()
-            
-            # Should have labels group and text element
-            assert 'id="panel-labels"' in svg_content
-            assert '<text' in svg_content
-            assert 'Test Panel' in svg_content
+        config = SVGConfig(show_labels=True)
+        renderer = SVGRenderer(config)
+        svg_content = renderer.render_to_string(test_lines, "Labels Test")
+        
+        # Should have labels group and text element
+        assert 'id="panel-labels"' in svg_content
+        assert '<text' in svg_content
+        assert 'Test Panel' in svg_content
     
     def test_no_labels(self):
         """Test SVG generation without labels."""
@@ -244,20 +519,13 @@ class TestSVGRenderer:
             GridLine(Point2D(0, 0), Point2D(100, 0), "Test Panel", "boundary")
         ]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "no_labels_test.svg"
-            
-            config = SVGConfig(show_labels=False)
-            renderer = SVGRenderer(config)
-            success = renderer.render(test_lines, str(output_path), "No Labels Test")
-            
-            assert success == True
-            
-            svg_content = output_path.read_text()
-            
-            # Should not have labels
-            assert 'id="panel-labels"' not in svg_content
-            assert '<text' not in svg_content
+        config = SVGConfig(show_labels=False)
+        renderer = SVGRenderer(config)
+        svg_content = renderer.render_to_string(test_lines, "No Labels Test")
+        
+        # Should not have labels
+        assert 'id="panel-labels"' not in svg_content
+        assert '<text' not in svg_content
     
     def test_file_size_estimation(self):
         """Test SVG file size estimation."""
@@ -299,19 +567,15 @@ class TestSVGConfigFactory:
 class TestIntegration:
     """Integration tests for grid generation and SVG rendering."""
     
-    def test_full_pipeline(self):
+    def test_full_pipeline(self, panels):
         """Test complete pipeline from layout to SVG file."""
-        # Create layout
-        layout_config = create_standard_3panel_config("standard", "standard")
-        layout = ThreePanelLayout(layout_config)
-        
         # Create camera
         camera = create_standard_camera(distance=12.0, fov_degrees=45.0)
         
         # Generate grid
         grid_config = GridConfig(density=0.8, show_panel_boundaries=True)
         generator = GridGenerator(grid_config)
-        grid_lines = generator.generate_grid(layout.get_panels(), camera, 1920, 1080)
+        grid_lines = generator.generate_grid(panels, camera, 1920, 1080)
         
         # Render SVG
         svg_config = create_standard_svg_config(1920, 1080)
@@ -1,6 +1,7 @@
 """Tests for layout system."""
 
 import pytest
+import numpy as np
 import sys
 import os
 
@@ -8,8 +9,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from layouts.base_layout import (
-    Panel, PanelDimensions, RoomDimensions, LayoutConfig, BaseLayout,
-    create_standard_panel_dimensions, create_standard_room_dimensions
+    Panel, CornerView, PanelDimensions, RoomDimensions, LayoutConfig, BaseLayout,
+    create_standard_panel_dimensions, create_standard_room_dimensions, unit_scale
 )
 from layouts.three_panel import ThreePanelLayout, create_standard_3panel_config
 from perspective.transforms import Point3D
@@ -29,6 +30,11 @@ class TestPanelDimensions:
         """Test default units."""
         dims = PanelDimensions(4.0, 4.0)
         assert dims.units == "inches"
+    
+    def test_slots(self):
+        """Test that instances use slots instead of a per-instance dict."""
+        dims = PanelDimensions(4.0, 4.0)
+        assert not hasattr(dims, "__dict__")
 
 
 class TestRoomDimensions:
@@ -114,6 +120,76 @@ class TestPanel:
         assert bounds["max_y"] == 2.0
         assert bounds["min_z"] == -3.0
         assert bounds["max_z"] == -3.0
+        
+        # Attribute access matches the string keys
+        assert bounds.min_x == bounds["min_x"]
+        assert bounds.max_y == 2.0
+    
+    def test_corners_array(self):
+        """Test that corners are mirrored into an (N, 3) array."""
+        corners = [
+            Point3D(0.0, 0.0, 0.0),
+            Point3D(2.0, 0.0, 0.0),
+            Point3D(2.0, 2.0, 0.0),
+            Point3D(0.0, 2.0, 0.0)
+        ]
+        normal = Point3D(0.0, 0.0, 1.0)
+        
+        panel = Panel("Test Panel", corners, normal, "wall")
+        
+        assert panel.corners_array.shape == (4, 3)
+        assert panel.corners_array[2].tolist() == [2.0, 2.0, 0.0]
+    
+    def test_array_corners(self):
+        """Test Panel creation directly from an (N, 3) array."""
+        corners = np.array([
+            [0.0, 0.0, 0.0],
+            [2.0, 0.0, 0.0],
+            [2.0, 2.0, 0.0],
+            [0.0, 2.0, 0.0]
+        ])
+        normal = Point3D(0.0, 0.0, 1.0)
+        
+        panel = Panel("Test Panel", corners, normal, "wall")
+        
+        assert len(panel.corners) == 4
+        assert isinstance(panel.corners[1], Point3D)
+        assert panel.corners[1].x == 2.0
+        assert [corner.y for corner in panel.corners] == [0.0, 0.0, 2.0, 2.0]
+        assert panel.get_center().x == 1.0
+    
+    def test_corners_single_source(self):
+        """Test that corners is a view of corners_array and reassigning it moves the panel."""
+        corners = [
+            Point3D(0.0, 0.0, 0.0),
+            Point3D(2.0, 0.0, 0.0),
+            Point3D(2.0, 2.0, 0.0),
+            Point3D(0.0, 2.0, 0.0)
+        ]
+        panel = Panel("Test Panel", corners, Point3D(0.0, 0.0, 1.0), "wall")
+        
+        # Same read-only view type for list and array input, equal to the list
+        assert isinstance(panel.corners, CornerView)
+        assert panel.corners == corners
+        
+        # Changing the input list afterwards does not touch the panel
+        corners[0] = Point3D(-5.0, 0.0, 0.0)
+        assert panel.get_bounds().min_x == 0.0
+        
+        panel.corners = np.array([[c.x, c.y, c.z] for c in corners]) + 10.0
+        assert panel.corners_array[0].tolist() == [5.0, 10.0, 10.0]
+        assert panel.get_bounds().min_x == 5.0
+        assert panel.get_center().x == 9.75
+    
+    def test_equality(self):
+        """Test that panels compare by value, including array corners."""
+        corners = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]])
+        normal = Point3D(0.0, 0.0, 1.0)
+        panel = Panel("Test Panel", corners, normal, "wall")
+        
+        assert panel == Panel("Test Panel", [Point3D(*row) for row in corners], normal, "wall")
+        assert panel != Panel("Test Panel", corners + 1.0, normal, "wall")
+        assert panel != Panel("Other Panel", corners, normal, "wall")
 
 
 class TestLayoutConfig:
@@ -252,6 +328,72 @@ class TestThreePanelLayout:
         assert bounds["min_y"] <= 0.0
         assert bounds["min_z"] <= 0.0
     
+    def test_corners_array(self):
+        """Test stacked corner array for the whole layout."""
+        config = create_standard_3panel_config()
+        layout = ThreePanelLayout(config)
+        corners = layout.get_corners_array()
+        
+        assert corners.shape == (12, 3)
+        assert corners is layout.get_corners_array()
+        assert corners.max(axis=0).tolist() == [
+            layout.get_total_bounds()["max_x"],
+            layout.get_total_bounds()["max_y"],
+            layout.get_total_bounds()["max_z"]
+        ]
+    
+    def test_moved_panel_updates_bounds(self):
+        """Test that layout bounds follow a panel whose corners are reassigned."""
+        layout = ThreePanelLayout(create_standard_3panel_config())
+        bounds = layout.get_total_bounds()
+        center = layout.get_center_point()
+        
+        floor = layout.get_panels()[0]
+        floor.corners = floor.corners_array - 100.0
+        
+        assert layout.get_total_bounds().min_x == bounds.min_x - 100.0
+        assert layout.get_center_point() != center
+        assert layout.get_corners_array()[0].tolist() == floor.corners_array[0].tolist()
+    
+    def test_bounds_caching(self):
+        """Test that bounds and center are memoized until invalidated."""
+        config = create_standard_3panel_config()
+        layout = ThreePanelLayout(config)
+        
+        assert layout.get_total_bounds() is layout.get_total_bounds()
+        assert layout.get_center_point() is layout.get_center_point()
+        
+        bounds = layout.get_total_bounds()
+        layout.invalidate()
+        assert layout.get_total_bounds() is not bounds
+        assert layout.get_total_bounds() == bounds
+    
+    def test_description_caching(self):
+        """Test that the description string is cached until invalidated."""
+        config = create_standard_3panel_config()
+        layout = ThreePanelLayout(config)
+        
+        description = layout.get_description()
+        assert layout.get_description() is description
+        
+        config.panel_dimensions.width = 12.0
+        layout.invalidate()
+        assert '12.0"' in layout.get_description()
+    
+    def test_config_change_refreshes_caches(self):
+        """Test that editing the config rebuilds cached geometry without invalidate()."""
+        config = create_standard_3panel_config()
+        layout = ThreePanelLayout(config)
+        bounds = layout.get_total_bounds()
+        layout.get_description()
+        
+        config.panel_dimensions.width = 12.0
+        assert '12.0"' in layout.get_description()
+        
+        config.room_dimensions.width *= 2
+        assert layout.get_total_bounds().max_x == bounds.max_x * 2
+        assert layout.get_center_point().x == bounds.max_x
+    
     def test_center_point(self):
         """Test center point calculation."""
         config = create_standard_3panel_config()
@@ -281,6 +423,23 @@ class TestThreePanelLayout:
         assert camera_target.y >= 0.0
         assert camera_target.z >= 0.0
     
+    def test_camera_view_modes(self):
+        """Test camera placement for each view mode."""
+        config = create_standard_3panel_config()
+        layout = ThreePanelLayout(config)
+        
+        corner = layout.get_optimal_camera_position()
+        assert corner.x < 0.0 and corner.z < 0.0
+        assert corner == layout.get_optimal_camera_position("corner")
+        
+        orbit = layout.get_optimal_camera_position("orbit")
+        assert orbit.x > 0.0
+        assert orbit.y > 0.0
+        assert orbit.z > 0.0
+        
+        with pytest.raises(ValueError):
+            layout.get_optimal_camera_position("overhead")
+    
     def test_description(self):
         """Test layout description generation."""
         config = create_standard_3panel_config()
@@ -344,6 +503,15 @@ class TestLayoutFactories:
         assert config.panel_dimensions.width == 6.0
         assert config.room_dimensions.width == 12.0
     
+    def test_unit_scale(self):
+        """Test unit conversion factors."""
+        assert unit_scale("feet", "inches") == 12.0
+        assert unit_scale("inches", "inches") == 1.0
+        assert abs(unit_scale("inches", "feet") - 1.0 / 12.0) < 1e-12
+        
+        # Unknown units fall back to inches
+        assert unit_scale("furlongs", "feet") == 1.0 / 12.0
+    
     def test_3panel_config_with_presets(self):
         """Test 3-panel config with different presets."""
         config = create_standard_3panel_config("large", "small")
@@ -4,10 +4,49 @@ import pytest
 import numpy as np
 from perspective.transforms import (
     Point3D, Point2D, Vector3D, Matrix4x4, 
-    project_to_screen, degrees_to_radians, radians_to_degrees
+    project_to_screen, project_points_to_screen, degrees_to_radians, radians_to_degrees
 )
 
 
+@pytest.fixture(scope="module")
+def perspective_45():
+    """Provide a square-aspect 45 degree perspective matrix; tests only read it."""
+    return Matrix4x4.perspective(np.pi/4, 1.0, 0.1, 100.0)
+
+
+def _assert_xyz(point, x: float, y: float, z: float):
+    """Assert that a point or vector has the given coordinates to within 1e-10."""
+    np.testing.assert_allclose((point.x, point.y, point.z), (x, y, z), rtol=0, atol=1e-10)
+
+
+IDENTITY_BYTES = np.eye(4).tobytes()
+
+# (matrix, input point, expected transformed coordinates), built once at import
+TRANSFORM_CASES = [
+    pytest.param(
+        Matrix4x4.translation(1.0, 2.0, 3.0), Point3D(0.0, 0.0, 0.0), (1.0, 2.0, 3.0),
+        id="translation"
+    ),
+    # After 90° Y rotation, X becomes Z
+    pytest.param(
+        Matrix4x4.rotation_y(np.pi / 2), Point3D(1.0, 0.0, 0.0), (0.0, 0.0, 1.0),
+        id="rotation_y"
+    ),
+    # The target lands on the view axis, -5 in view space
+    pytest.param(
+        Matrix4x4.look_at(Point3D(0.0, 0.0, 5.0), Point3D(0.0, 0.0, 0.0), Vector3D(0.0, 1.0, 0.0)),
+        Point3D(0.0, 0.0, 0.0), (0.0, 0.0, -5.0),
+        id="look_at"
+    ),
+    # Point at origin, translated by (1,0,0), then rotated 90° around Y
+    pytest.param(
+        Matrix4x4.rotation_y(np.pi / 2).multiply(Matrix4x4.translation(1.0, 0.0, 0.0)),
+        Point3D(0.0, 0.0, 0.0), (0.0, 0.0, 1.0),
+        id="matrix_multiplication"
+    ),
+]
+
+
 class TestPoint3D:
     """Test Point3D class."""
     
@@ -24,6 +63,11 @@ class TestPoint3D:
         array = point.to_array()
         expected = np.array([1.0, 2.0, 3.0, 1.0])
         np.testing.assert_array_equal(array, expected)
+        
+        # Writing into a caller-provided buffer returns that buffer
+        buffer = np.zeros(4)
+        assert point.to_array(out=buffer) is buffer
+        np.testing.assert_array_equal(buffer, expected)
     
     def test_from_array(self):
         """Test creation from numpy array."""
@@ -32,6 +76,16 @@ class TestPoint3D:
         assert point.x == 1.0
         assert point.y == 2.0
         assert point.z == 3.0
+    
+    def test_array_round_trip(self):
+        """Test that rows of a homogeneous point array survive from_array/to_array."""
+        points = np.array([
+            [1.0, 2.0, 3.0, 1.0],
+            [0.0, 0.0, 0.0, 1.0],
+            [-4.5, 0.25, 1e6, 1.0],
+        ])
+        round_trip = np.stack([Point3D.from_array(row).to_array() for row in points])
+        np.testing.assert_array_equal(round_trip, points)
 
 
 class TestPoint2D:
@@ -42,6 +96,7 @@ class TestPoint2D:
         point = Point2D(10.0, 20.0)
         assert point.x == 10.0
         assert point.y == 20.0
+        assert not hasattr(point, "__dict__")
 
 
 class TestVector3D:
@@ -58,9 +113,7 @@ class TestVector3D:
         """Test vector normalization."""
         vector = Vector3D(3.0, 4.0, 0.0)
         normalized = vector.normalize()
-        assert abs(normalized.x - 0.6) < 1e-10
-        assert abs(normalized.y - 0.8) < 1e-10
-        assert abs(normalized.z - 0.0) < 1e-10
+        _assert_xyz(normalized, 0.6, 0.8, 0.0)
     
     def test_normalize_zero_vector(self):
         """Test normalization of zero vector."""
@@ -85,6 +138,19 @@ class TestVector3D:
         v2 = Vector3D(4.0, 5.0, 6.0)
         dot = v1.dot(v2)
         assert dot == 32.0  # 1*4 + 2*5 + 3*6
+    
+    def test_cross_and_dot_match_numpy(self):
+        """Test cross and dot products of random vectors against NumPy's batched versions."""
+        rng = np.random.default_rng(0)
+        a = rng.standard_normal((1000, 3))
+        b = rng.standard_normal((1000, 3))
+        pairs = [(Vector3D(*u), Vector3D(*v)) for u, v in zip(a, b)]
+        
+        crosses = np.array([(c.x, c.y, c.z) for c in (u.cross(v) for u, v in pairs)])
+        dots = np.array([u.dot(v) for u, v in pairs])
+        
+        np.testing.assert_allclose(crosses, np.cross(a, b), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(dots, np.einsum('ij,ij->i', a, b), rtol=1e-12, atol=1e-12)
 
 
 class TestMatrix4x4:
@@ -93,29 +159,46 @@ class TestMatrix4x4:
     def test_identity(self):
         """Test identity matrix creation."""
         matrix = Matrix4x4.identity()
-        expected = np.eye(4)
-        np.testing.assert_array_equal(matrix.matrix, expected)
+        
+        # Bit-exact: same dtype, shape and bytes as np.eye(4)
+        assert matrix.matrix.dtype == np.float64
+        assert matrix.matrix.shape == (4, 4)
+        assert matrix.matrix.tobytes() == IDENTITY_BYTES
     
-    def test_translation(self):
-        """Test translation matrix."""
-        matrix = Matrix4x4.translation(1.0, 2.0, 3.0)
-        point = Point3D(0.0, 0.0, 0.0)
-        transformed = matrix.transform_point(point)
-        assert transformed.x == 1.0
-        assert transformed.y == 2.0
-        assert transformed.z == 3.0
-    
-    def test_rotation_y(self):
-        """Test rotation around Y axis."""
-        # 90 degree rotation
-        matrix = Matrix4x4.rotation_y(np.pi / 2)
-        point = Point3D(1.0, 0.0, 0.0)
-        transformed = matrix.transform_point(point)
+    def test_identity_is_cached(self):
+        """Test that the identity matrix is shared and protected from modification."""
+        matrix = Matrix4x4.identity()
+        assert Matrix4x4.identity() is matrix
+        
+        with pytest.raises(ValueError):
+            matrix.matrix[0, 3] = 1.0
         
-        # After 90° Y rotation, X becomes Z
-        assert abs(transformed.x) < 1e-10  # Should be ~0
-        assert abs(transformed.y) < 1e-10  # Should be ~0
-        assert abs(transformed.z - 1.0) < 1e-10  # Should be ~1
+        # Products and copies are ordinary writable matrices
+        product = matrix.multiply(Matrix4x4.translation(1.0, 2.0, 3.0))
+        product.matrix[0, 0] = 2.0
+        assert Matrix4x4(matrix.matrix).matrix.flags.writeable
+        np.testing.assert_array_equal(matrix.matrix, np.eye(4))
+    
+    @pytest.mark.parametrize("matrix, point, expected", TRANSFORM_CASES)
+    def test_transform_point(self, matrix, point, expected):
+        """Test translation, rotation, look-at and combined matrices on single points."""
+        _assert_xyz(matrix.transform_point(point), *expected)
+    
+    def test_rotation_y_quarter_turns(self):
+        """Test that quarter-turn rotations are exact and other angles use trig."""
+        for angle, cos_a, sin_a in [(0.0, 1.0, 0.0), (np.pi / 2, 0.0, 1.0), (np.pi, -1.0, 0.0),
+                                    (3 * np.pi / 2, 0.0, -1.0), (-np.pi / 2, 0.0, -1.0)]:
+            matrix = Matrix4x4.rotation_y(angle).matrix
+            assert (matrix[0, 0], matrix[0, 2], matrix[2, 0], matrix[2, 2]) == (cos_a, sin_a, -sin_a, cos_a)
+        
+        matrix = Matrix4x4.rotation_y(0.3).matrix
+        assert (matrix[0, 0], matrix[0, 2]) == (np.cos(0.3), np.sin(0.3))
+        
+        # NumPy scalars and 0-d arrays are accepted like plain floats
+        np.testing.assert_array_equal(Matrix4x4.rotation_y(np.array(0.3)).matrix, matrix)
+        np.testing.assert_array_equal(
+            Matrix4x4.rotation_y(np.array(np.pi / 2)).matrix, Matrix4x4.rotation_y(np.pi / 2).matrix
+        )
     
     def test_perspective_matrix(self):
         """Test perspective projection matrix creation."""
@@ -130,42 +213,74 @@ class TestMatrix4x4:
         assert matrix.matrix[3, 2] == -1.0  # Perspective division component
         assert matrix.matrix[2, 3] != 0.0   # Z translation component
     
-    def test_look_at(self):
-        """Test look-at matrix creation."""
-        eye = Point3D(0.0, 0.0, 5.0)
-        target = Point3D(0.0, 0.0, 0.0)
-        up = Vector3D(0.0, 1.0, 0.0)
+    def test_matrices_c_contiguous(self, perspective_45):
+        """Test that matrices are C-contiguous and multiply is a plain matmul."""
+        look_at = Matrix4x4.look_at(
+            Point3D(3.0, 2.0, 6.0), Point3D(0.0, 0.0, 0.0), Vector3D(0.0, 1.0, 0.0)
+        )
+        product = perspective_45.multiply(look_at)
+        
+        for matrix in (Matrix4x4.identity(), Matrix4x4.translation(1.0, 2.0, 3.0),
+                       Matrix4x4.rotation_y(0.3), perspective_45, look_at, product):
+            assert matrix.matrix.flags["C_CONTIGUOUS"]
+            assert matrix.matrix.dtype == np.float64
         
-        matrix = Matrix4x4.look_at(eye, target, up)
+        np.testing.assert_array_equal(product.matrix, np.matmul(perspective_45.matrix, look_at.matrix))
+    
+    def test_transform_points(self, perspective_45):
+        """Test that batched transforms match per-point transforms."""
+        points = np.random.default_rng(0).standard_normal((1000, 3))
+        points[0] = (1.0, 1.0, 0.0)  # w == 0 under perspective, so no division
         
-        # Transform the target point - should be at origin in view space
-        view_target = matrix.transform_point(target)
-        assert abs(view_target.x) < 1e-10
-        assert abs(view_target.y) < 1e-10
-        assert abs(view_target.z - (-5.0)) < 1e-10  # Should be -5 in view space
+        for matrix in (perspective_45, Matrix4x4.translation(1.0, 2.0, 3.0)):
+            transformed = matrix.transform_points(points)
+            
+            assert transformed.shape == (1000, 3)
+            expected = [
+                (p.x, p.y, p.z) for p in (matrix.transform_point(Point3D(*point)) for point in points)
+            ]
+            np.testing.assert_allclose(transformed, expected, rtol=1e-12, atol=1e-12)
     
-    def test_matrix_multiplication(self):
-        """Test matrix multiplication."""
-        # Translation then rotation
-        translation = Matrix4x4.translation(1.0, 0.0, 0.0)
-        rotation = Matrix4x4.rotation_y(np.pi / 2)
+    def test_random_matrices_match_einsum(self):
+        """Test scalar and batched transforms of random matrices against an einsum oracle."""
+        rng = np.random.default_rng(0)
+        matrices = rng.uniform(-10.0, 10.0, size=(8, 4, 4))
+        points = rng.uniform(-10.0, 10.0, size=(8, 16, 3))
         
-        combined = rotation.multiply(translation)
+        homogeneous = np.concatenate([points, np.ones((8, 16, 1))], axis=-1)
+        oracle = np.einsum('bij,bkj->bki', matrices, homogeneous)
+        w = oracle[..., 3:]
+        # Keep w away from zero so the division is well conditioned; both signs stay
+        assert (w < 0).any() and (w > 0).any()
+        keep = np.abs(w[..., 0]) > 1e-3
+        expected = oracle[..., :3] / w
         
-        point = Point3D(0.0, 0.0, 0.0)
-        result = combined.transform_point(point)
+        for matrix_values, batch, expected_batch, keep_batch in zip(matrices, points, expected, keep):
+            matrix = Matrix4x4(matrix_values)
+            
+            np.testing.assert_allclose(
+                matrix.transform_points(batch)[keep_batch], expected_batch[keep_batch], rtol=1e-9
+            )
+            scalar = [(p.x, p.y, p.z) for p in map(matrix.transform_point, map(Point3D.from_array, batch))]
+            np.testing.assert_allclose(np.array(scalar)[keep_batch], expected_batch[keep_batch], rtol=1e-9)
+    
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_transform_points_dtype(self, perspective_45, dtype):
+        """Test that batched transforms keep float32 input in float32."""
+        points = np.random.default_rng(0).standard_normal((100, 3)).astype(dtype)
+        
+        transformed = perspective_45.transform_points(points)
         
-        # Point at origin, translated by (1,0,0), then rotated 90° around Y
-        # Should end up at (0,0,1)
-        assert abs(result.x) < 1e-10
-        assert abs(result.y) < 1e-10
-        assert abs(result.z - 1.0) < 1e-10
+        assert transformed.dtype == dtype
+        np.testing.assert_allclose(
+            transformed, perspective_45.transform_points(points.astype(np.float64)), rtol=1e-4, atol=1e-5
+        )
 
 
 class TestProjection:
     """Test projection functions."""
     
-    def test_project_to_screen(self):
+    def test_project_to_screen(self, perspective_45):
         """Test 3D to 2D projection."""
         # Simple case: point at origin, camera looking down negative Z
         point_3d = Point3D(0.0, 0.0, -1.0)
@@ -174,7 +289,7 @@ class TestProjection:
         view_matrix = Matrix4x4.identity()
         
         # Simple perspective matrix
-        projection_matrix = Matrix4x4.perspective(np.pi/4, 1.0, 0.1, 100.0)
+        projection_matrix = perspective_45
         
         screen_width = 800
         screen_height = 600
@@ -186,36 +301,88 @@ class TestProjection:
         # Point should project to center of screen
         assert abs(point_2d.x - screen_width/2) < 1.0
         assert abs(point_2d.y - screen_height/2) < 1.0
+        
+        # Every point on the view axis lands there too when projected as a batch
+        points = np.array([[0.0, 0.0, -z] for z in (0.5, 1.0, 10.0, 99.0)])
+        screen = project_points_to_screen(
+            points, projection_matrix.multiply(view_matrix), screen_width, screen_height
+        )
+        np.testing.assert_allclose(
+            screen, np.tile([screen_width/2, screen_height/2], (len(points), 1)), atol=1.0
+        )
+    
+    def test_project_points_to_screen(self):
+        """Test that batched projection matches per-point projection."""
+        view_matrix = Matrix4x4.look_at(
+            Point3D(3.0, 2.0, 6.0), Point3D(0.0, 0.0, 0.0), Vector3D(0.0, 1.0, 0.0)
+        )
+        projection_matrix = Matrix4x4.perspective(np.pi/3, 4.0/3.0, 0.1, 100.0)
+        mvp = projection_matrix.multiply(view_matrix)
+        
+        points = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, -1.0], [-2.0, 0.5, 3.0]])
+        screen = project_points_to_screen(points, mvp, 800, 600)
+        
+        assert screen.shape == (3, 2)
+        for point, (x, y) in zip(points, screen):
+            expected = project_to_screen(
+                Point3D(*point), view_matrix, projection_matrix, 800, 600
+            )
+            assert abs(x - expected.x) < 1e-9
+            assert abs(y - expected.y) < 1e-9
     
     def test_degrees_to_radians(self):
         """Test degree to radian conversion."""
-        assert abs(degrees_to_radians(180.0) - np.pi) < 1e-10
-        assert abs(degrees_to_radians(90.0) - np.pi/2) < 1e-10
-        assert abs(degrees_to_radians(0.0)) < 1e-10
+        assert (degrees_to_radians(180.0), degrees_to_radians(90.0), degrees_to_radians(0.0)) \
+            == pytest.approx((np.pi, np.pi/2, 0.0), abs=1e-10)
+        
+        # Arrays convert element-wise
+        degrees = np.linspace(-720.0, 720.0, 1001)
+        np.testing.assert_allclose(degrees_to_radians(degrees), np.deg2rad(degrees), rtol=1e-14)
     
     def test_radians_to_degrees(self):
         """Test radian to degree conversion."""
-        assert abs(radians_to_degrees(np.pi) - 180.0) < 1e-10
-        assert abs(radians_to_degrees(np.pi/2) - 90.0) < 1e-10
-        assert abs(radians_to_degrees(0.0)) < 1e-10
+        assert (radians_to_degrees(np.pi), radians_to_degrees(np.pi/2), radians_to_degrees(0.0)) \
+            == pytest.approx((180.0, 90.0, 0.0), abs=1e-10)
+        
+        # Arrays convert element-wise
+        radians = np.linspace(-4 * np.pi, 4 * np.pi, 1001)
+        np.testing.assert_allclose(radians_to_degrees(radians), np.rad2deg(radians), rtol=1e-14)
 
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
     
-    def test_transform_point_with_perspective_division(self):
+    def test_transform_point_avoids_np_dot(self, monkeypatch, perspective_45):
+        """Test that single-point transforms don't go through np.dot."""
+        # np.dot on a 4-vector costs more in dispatch than the 16 multiply-adds
+        def forbidden_dot(*args, **kwargs):
+            raise AssertionError("transform_point called np.dot")
+        
+        expected = perspective_45.matrix @ Point3D(1.0, 1.0, -2.0).to_array()
+        monkeypatch.setattr(np, "dot", forbidden_dot)
+        
+        transformed = perspective_45.transform_point(Point3D(1.0, 1.0, -2.0))
+        np.testing.assert_allclose(
+            [transformed.x, transformed.y, transformed.z], expected[:3] / expected[3]
+        )
+    
+    def test_transform_point_with_perspective_division(self, perspective_45):
         """Test point transformation with perspective division."""
         # Create a matrix that will result in w != 1
-        matrix = Matrix4x4.perspective(np.pi/4, 1.0, 0.1, 100.0)
+        matrix = perspective_45
         point = Point3D(1.0, 1.0, -2.0)
         
         # Should not raise exception and should handle perspective division
         transformed = matrix.transform_point(point)
         
         # Result should be valid numbers
-        assert not np.isnan(transformed.x)
-        assert not np.isnan(transformed.y)
-        assert not np.isnan(transformed.z)
+        assert np.all(np.isfinite([transformed.x, transformed.y, transformed.z]))
+        
+        # And should match the homogeneous matrix product
+        expected = matrix.matrix @ point.to_array()
+        np.testing.assert_allclose(
+            [transformed.x, transformed.y, transformed.z], expected[:3] / expected[3]
+        )
 
 
 if __name__ == "__main__":